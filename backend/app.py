@@ -1,12 +1,17 @@
+import hashlib
 import logging
+import mimetypes
 import os
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
+from starlette.types import Scope
 
 from backend.database import engine, Base
 from backend.models import Contact, Message, DailyBatch, DailyBatchContact  # noqa: F401
@@ -18,6 +23,69 @@ logger = logging.getLogger("minutely")
 
 # Path to built frontend
 FRONTEND_DIR = Path(__file__).parent.parent / "frontend" / "dist"
+FRONTEND_ROOT = FRONTEND_DIR.resolve()
+FRONTEND_INDEX = FRONTEND_ROOT / "index.html"
+# Unmatched paths under these prefixes 404 instead of falling back to the SPA
+_API_PREFIXES = ("api/",)
+
+
+def _create_all() -> bool:
+    """create_all plus any indexes missing on tables that already existed.
+
+    create_all only emits CREATE INDEX for tables it creates, so indexes added
+    to a model later would never reach an existing database. Returns False if
+    an index could not be created, so the caller doesn't record the schema
+    fingerprint and retries on the next boot.
+    """
+    Base.metadata.create_all(bind=engine)
+    ok = True
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(bind=engine, checkfirst=True)
+            except Exception as e:
+                logger.warning(f"Could not create index {index.name}: {e}")
+                ok = False
+    return ok
+
+
+def _create_tables():
+    """Run create_all only when the model schema changed since the last boot.
+
+    A fingerprint of the table DDL is stored in SQLite's PRAGMA user_version;
+    other backends always run create_all.
+    """
+    from sqlalchemy import text
+    from sqlalchemy.schema import CreateIndex, CreateTable
+
+    statements = []
+    for table in Base.metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(engine)))
+        statements.extend(
+            str(CreateIndex(index).compile(engine))
+            for index in sorted(table.indexes, key=lambda i: i.name or "")
+        )
+    ddl = "|".join(statements)
+    # user_version is a signed 32-bit int: keep the fingerprint below 2**31
+    fingerprint = int(hashlib.sha1(ddl.encode()).hexdigest()[:7], 16)
+
+    if engine.dialect.name != "sqlite":
+        _create_all()
+        return
+
+    try:
+        with engine.connect() as conn:
+            current = conn.execute(text("PRAGMA user_version")).scalar()
+        if current == fingerprint:
+            logger.info("Database schema unchanged, skipping create_all.")
+            return
+        if not _create_all():
+            return
+        with engine.begin() as conn:
+            conn.execute(text(f"PRAGMA user_version = {fingerprint}"))
+    except Exception as e:
+        logger.warning(f"Schema fingerprint check failed ({e}), running create_all.")
+        _create_all()
 
 
 def _run_migrations():
@@ -52,6 +120,8 @@ def _run_migrations():
             logger.info("Migration: added user_id column to daily_batches.")
 
     # One-time: extract company from title for contacts missing company
+    if "contacts" not in insp.get_table_names():
+        return
     from backend.database import SessionLocal
     from backend.models.contact import Contact
     from backend.worker.linkedin_worker import extract_company_from_title
@@ -80,6 +150,89 @@ def _run_migrations():
         db.close()
 
 
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles for Vite's hashed bundles.
+
+    Adds a long-lived immutable Cache-Control header and serves a precompressed
+    .br/.gz sibling when one exists and the client accepts that encoding.
+    """
+
+    _ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+    async def get_response(self, path: str, scope: Scope):
+        accept = ""
+        for key, value in scope["headers"]:
+            if key == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+
+        response = None
+        for encoding, suffix in self._ENCODINGS:
+            if encoding in accept and os.path.isfile(os.path.join(self.directory, path + suffix)):
+                response = await super().get_response(path + suffix, scope)
+                response.headers["Content-Encoding"] = encoding
+                response.headers["Content-Type"] = (
+                    mimetypes.guess_type(path)[0] or "application/octet-stream"
+                )
+                break
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+
+@lru_cache(maxsize=1024)
+def _resolve_frontend_path(full_path: str) -> Path:
+    """Map a request path to a file inside the built frontend, or index.html.
+
+    Paths that escape the frontend root fall back to index.html. The build
+    output doesn't change while the server runs, so results are cached.
+    """
+    file_path = (FRONTEND_ROOT / full_path).resolve()
+    if FRONTEND_ROOT in file_path.parents and file_path.is_file():
+        return file_path
+    return FRONTEND_INDEX
+
+
+@lru_cache(maxsize=1024)
+def _frontend_etag(file_path: Path) -> str:
+    """Strong ETag from size and mtime, computed once per served file."""
+    st = file_path.stat()
+    return f'"{st.st_size:x}-{int(st.st_mtime):x}"'
+
+
+def _register_routes(app: FastAPI):
+    """Import API routers and mount the frontend.
+
+    Called once, at the bottom of this module: the SPA catch-all must be
+    registered after every API route (including /api/health) so it doesn't
+    shadow them.
+    """
+    from backend.routers import contacts, messages, batches, linkedin
+
+    app.include_router(contacts.router, prefix="/api/contacts", tags=["contacts"])
+    app.include_router(messages.router, prefix="/api/messages", tags=["messages"])
+    app.include_router(batches.router, prefix="/api/batches", tags=["batches"])
+    app.include_router(linkedin.router, prefix="/api/linkedin", tags=["linkedin"])
+
+    # Serve built React frontend (must be after API routes)
+    if FRONTEND_DIR.exists():
+        app.mount("/assets", CachedStaticFiles(directory=FRONTEND_DIR / "assets"), name="static")
+
+        @app.get("/{full_path:path}")
+        async def serve_frontend(request: Request, full_path: str):
+            """Serve React app for all non-API routes (SPA fallback)."""
+            if full_path.startswith(_API_PREFIXES):
+                return Response(status_code=404)
+            file_path = _resolve_frontend_path(full_path)
+            etag = _frontend_etag(file_path)
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers={"ETag": etag})
+            return FileResponse(file_path, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown logic."""
@@ -89,62 +242,80 @@ async def lifespan(app: FastAPI):
     (settings.data_dir / "logs").mkdir(exist_ok=True)
     logger.info(f"Data directory: {settings.data_dir}")
 
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
+    # Add missing columns first, so indexes on them can be built in the same
+    # boot; then create tables (skipped when the schema fingerprint is unchanged)
     _run_migrations()
+    _create_tables()
     logger.info("Database tables created.")
 
-    # One-time CSV migration
-    migrate_leads_csv(settings.leads_csv)
-
-    # Start the worker pool
-    await worker_pool.start()
+    # One-time CSV migration; re-parse only if leads.csv changed since last run
+    sentinel = settings.data_dir / ".leads_csv.migrated"
+    csv_path = settings.leads_csv
+    if (
+        sentinel.exists()
+        and csv_path.exists()
+        and sentinel.stat().st_mtime >= csv_path.stat().st_mtime
+    ):
+        logger.info("leads.csv unchanged since last migration, skipping.")
+    else:
+        migrate_leads_csv(csv_path)
+        if csv_path.exists():
+            sentinel.touch()
 
-    yield
+    # Start the worker pool. A failure here shouldn't take the API down with it.
+    try:
+        await worker_pool.start()
+    except Exception:
+        logger.exception("Worker pool failed to start; API will run without it.")
 
-    # Shutdown
-    await worker_pool.stop()
-    logger.info("Shutting down.")
+    try:
+        yield
+    finally:
+        # Shutdown
+        await worker_pool.stop()
+        logger.info("Shutting down.")
 
 
-app = FastAPI(title="Minute.ly", version="1.0.0", lifespan=lifespan)
+app = FastAPI(
+    title="Minute.ly",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    docs_url="/docs" if settings.enable_docs else None,
+    redoc_url=None,
+    openapi_url="/openapi.json" if settings.enable_docs else None,
+)
 
 # CORS - allow React dev server (for local development)
-allowed_origins = ["http://localhost:5173", "http://localhost:3000"]
-railway_url = os.environ.get("RAILWAY_PUBLIC_DOMAIN")
-if railway_url:
-    allowed_origins.append(f"https://{railway_url}")
+# A frozenset keeps the per-request origin check a hash lookup.
+ALLOWED_ORIGINS = frozenset(
+    ["http://localhost:5173", "http://localhost:3000"]
+    + ([f"https://{settings.railway_public_domain}"] if settings.railway_public_domain else [])
+)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=allowed_origins,
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
+    allow_headers=["authorization", "content-type", "x-requested-with"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
-# Import and register routers
-from backend.routers import contacts, messages, batches, linkedin  # noqa: E402
+# Compress JSON lists and index.html; responses that already carry a
+# Content-Encoding (precompressed assets) pass through untouched.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
-app.include_router(contacts.router, prefix="/api/contacts", tags=["contacts"])
-app.include_router(messages.router, prefix="/api/messages", tags=["messages"])
-app.include_router(batches.router, prefix="/api/batches", tags=["batches"])
-app.include_router(linkedin.router, prefix="/api/linkedin", tags=["linkedin"])
 
+_HEALTH_BODY = b'{"status":"ok"}'
 
-@app.get("/api/health")
-async def health():
-    return {"status": "ok"}
 
+@app.get("/api/health", include_in_schema=False)
+async def health():
+    # Pre-serialized body: skips response validation and JSON encoding.
+    # A fresh Response per call, since middleware may mutate its headers.
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
-# Serve built React frontend (must be after API routes)
-if FRONTEND_DIR.exists():
-    app.mount("/assets", StaticFiles(directory=FRONTEND_DIR / "assets"), name="static")
 
-    @app.get("/{full_path:path}")
-    async def serve_frontend(request: Request, full_path: str):
-        """Serve React app for all non-API routes (SPA fallback)."""
-        file_path = FRONTEND_DIR / full_path
-        if file_path.is_file():
-            return FileResponse(file_path)
-        return FileResponse(FRONTEND_DIR / "index.html")
+# Import and register routers, then the frontend catch-all
+_register_routes(app)
@@ -17,6 +17,8 @@ from typing import Optional
 
 from fastapi import Request, HTTPException, Response
 
+from backend.config import settings
+
 logger = logging.getLogger("minutely")
 
 SESSION_TTL = 30 * 24 * 3600  # 30 days
@@ -25,9 +27,7 @@ COOKIE_NAME = "session_token"
 
 def _sessions_file() -> Path:
     """Path to the persisted sessions file."""
-    import os
-    data_dir = Path(os.environ.get("DATA_DIR", "."))
-    return data_dir / "sessions.json"
+    return settings.data_dir / "sessions.json"
 
 
 @dataclass
@@ -1,40 +1,45 @@
 import os
+from dataclasses import dataclass
 from pathlib import Path
 from dotenv import load_dotenv
 
+# Project root, resolved once at import
+BASE_DIR = Path(__file__).resolve().parent.parent
+
 # Load .env from project root
-load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+load_dotenv(BASE_DIR / ".env")
+
+# DATA_DIR env var: mount a Railway volume here for persistent storage
+DATA_DIR = Path(os.getenv("DATA_DIR", str(BASE_DIR)))
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Application settings loaded from environment variables."""
+    """Application settings loaded from environment variables.
+
+    Values are read once at import; the instance is immutable.
+    """
 
     # --- Paths ---
-    base_dir: Path = Path(__file__).resolve().parent.parent
-    # DATA_DIR env var: mount a Railway volume here for persistent storage
-    data_dir: Path = Path(os.getenv("DATA_DIR", str(base_dir)))
-    database_url: str = os.getenv(
-        "DATABASE_URL",
-        "sqlite:///" + str(Path(os.getenv("DATA_DIR", str(base_dir))) / "minutely.db"),
-    )
-    cookies_dir: Path = Path(os.getenv("DATA_DIR", str(base_dir))) / "cookies"
+    base_dir: Path = BASE_DIR
+    data_dir: Path = DATA_DIR
+    database_url: str = os.getenv("DATABASE_URL", "sqlite:///" + str(DATA_DIR / "minutely.db"))
+    cookies_dir: Path = DATA_DIR / "cookies"
     # Legacy single-user cookies path (kept for migration)
-    cookies_file: Path = cookies_dir / "linkedin_cookies.json"
-    demo_video_file: Path = base_dir / "assets" / "minutely.mp4"
-    logs_dir: Path = Path(os.getenv("DATA_DIR", str(base_dir))) / "logs"
-    leads_csv: Path = base_dir / "leads.csv"
+    cookies_file: Path = DATA_DIR / "cookies" / "linkedin_cookies.json"
+    demo_video_file: Path = BASE_DIR / "assets" / "minutely.mp4"
+    logs_dir: Path = DATA_DIR / "logs"
+    leads_csv: Path = BASE_DIR / "leads.csv"
 
     # --- Worker Pool ---
     max_concurrent_browsers: int = int(os.getenv("MAX_BROWSERS", "3"))
     session_idle_timeout: int = int(os.getenv("SESSION_IDLE_TIMEOUT", "600"))
+    # Profile visits before a session's browser context is recycled (0 = never)
+    context_rotate_navigations: int = int(os.getenv("CONTEXT_ROTATE_NAVIGATIONS", "200"))
 
     # --- API Keys ---
     gemini_api_key: str = os.getenv("GEMINI_API_KEY", "")
 
-    def cookies_file_for(self, user_id: str) -> Path:
-        """Get the cookie file path for a specific user."""
-        return self.cookies_dir / f"{user_id}.json"
-
     # --- Batch Settings ---
     batch_size: int = int(os.getenv("BATCH_SIZE", "10"))
     cooldown_days: int = int(os.getenv("COOLDOWN_DAYS", "60"))
@@ -44,10 +49,23 @@ class Settings:
     min_delay: int = int(os.getenv("MIN_DELAY", "60"))
     max_delay: int = int(os.getenv("MAX_DELAY", "120"))
 
+    # --- Deployment ---
+    host: str = os.getenv("HOST", "0.0.0.0")
+    port: int = int(os.getenv("PORT", "8000"))
+    railway_public_domain: str = os.getenv("RAILWAY_PUBLIC_DOMAIN", "")
+    # Headless browsers on Railway / when PRODUCTION is set
+    is_production: bool = bool(os.getenv("RAILWAY_ENVIRONMENT") or os.getenv("PRODUCTION"))
+    # Serve /docs and /openapi.json (off by default; set ENABLE_DOCS=1 locally)
+    enable_docs: bool = os.getenv("ENABLE_DOCS", "0") == "1"
+
     # --- LinkedIn ---
     daily_limit: int = int(os.getenv("DAILY_LIMIT", "20"))
     connection_note_max_chars: int = 300
 
+    def cookies_file_for(self, user_id: str) -> Path:
+        """Get the cookie file path for a specific user."""
+        return self.cookies_dir / f"{user_id}.json"
+
     def validate(self):
         if not self.gemini_api_key:
             raise EnvironmentError("GEMINI_API_KEY is required in .env")
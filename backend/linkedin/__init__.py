@@ -1,5 +1,27 @@
-from backend.linkedin.automation import LinkedInAutomation
-from backend.linkedin.cookies import CookieManager
-from backend.linkedin.classifier import GeminiClassifier
+"""LinkedIn automation package.
+
+Exports are resolved lazily (PEP 562) so importing a submodule such as
+backend.linkedin.cookies doesn't drag in Playwright and google-generativeai.
+"""
+import importlib
 
 __all__ = ["LinkedInAutomation", "CookieManager", "GeminiClassifier"]
+
+_LAZY_ATTRS = {
+    "LinkedInAutomation": "backend.linkedin.automation",
+    "CookieManager": "backend.linkedin.cookies",
+    "GeminiClassifier": "backend.linkedin.classifier",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(importlib.import_module(module_name), name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
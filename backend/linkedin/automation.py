@@ -6,24 +6,256 @@ SELECTOR STRATEGY (Critical -- LinkedIn changes DOM frequently):
   1. ARIA / role selectors FIRST: get_by_role(), get_by_label()
   2. Text-based selectors SECOND: get_by_text(), locator("text=...")
   3. CSS selectors LAST RESORT: .class-name, #id
+  Exception: checks that run on every profile (is_connected, is_pending, the
+  Connect button) try an aria-label/text CSS selector first, because role
+  lookups match accessible names in JS and are noticeably slower. The role
+  selector stays as the fallback.
 
 Every method returns gracefully on failure (empty string, False, "Error").
 """
 import logging
 import re
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Union
+
+from playwright.sync_api import Locator, Page, expect
+
+from backend.config import settings
+
+logger = logging.getLogger("minutely")
+
+
+# Patterns used on every profile / message, compiled once
+_PROFILE_ID_RE = re.compile(r"/in/([^/?#]+)")
+_NOT_ME_PROFILE_URL_RE = re.compile(r"/in/(?!me(/|$))")  # /in/ NOT followed by "me"
+_MESSAGE_NAME_RE = re.compile(r"^Message$", re.I)
+_PENDING_NAME_RE = re.compile(r"Pending", re.I)
+_CONNECT_NAME_RE = re.compile(r"^Connect$", re.I)
+_CONNECT_MENU_RE = re.compile(r"Connect", re.I)
+_ADD_NOTE_NAME_RE = re.compile(r"Add a note", re.I)
+_SEND_PREFIX_RE = re.compile(r"^Send", re.I)
+_SEND_NAME_RE = re.compile(r"^(Send|שלח)$", re.I)
+
+# URL fragments checked against the lowercased page URL
+_LOGIN_URL_TERMS = ("linkedin.com/login", "linkedin.com/authwall")
+_SECURITY_URL_TERMS = ("checkpoint", "challenge", "security")
+
+# Settle predicates for the message editor (the focused contenteditable)
+_EDITOR_EMPTY_JS = """() => {
+    const el = document.activeElement;
+    return !!el && el.isContentEditable && !el.innerText.trim();
+}"""
+_EDITOR_FILLED_JS = """() => {
+    const el = document.activeElement;
+    return !!el && el.isContentEditable && el.innerText.trim().length > 0;
+}"""
+# Message box text once LinkedIn has cleared it after a send (a stray line
+# break or placeholder may remain)
+_CLEARED_TEXT_RE = re.compile(r"^\s*[\s\S]{0,20}?\s*$")
+
+# Selector fallbacks, in priority order
+_NOTE_TEXTAREA_SELECTOR = "#custom-message, textarea[name='message'], textarea"
+_FILE_INPUT_SELECTOR = (
+    '.msg-overlay-conversation-bubble input[type="file"], '
+    '.msg-form input[type="file"], '
+    'input[type="file"]'
+)
+_ATTACH_SELECTORS = (
+    "button[aria-label*='Attach' i]",
+    "button[aria-label*='file' i]",
+    "button[aria-label*='צרף']",
+    "button[aria-label*='קובץ']",
+    ".msg-form__footer-action button[aria-label*='Attach' i]",
+    ".msg-form__left-actions button[aria-label*='Attach' i]",
+    "button[data-control-name*='attach' i]",
+    ".msg-form__left-actions button",
+)
+_MESSAGE_BUTTON_SELECTORS = (
+    "main button:has-text('Message')",
+    "main a:has-text('Message')",
+    "main button:has-text('הודעה')",
+    "main a:has-text('הודעה')",
+)
+_MSG_BOX_SELECTORS = (
+    "div[role='textbox'][contenteditable='true'][aria-label*='Write a message' i]",
+    "div[role='textbox'][contenteditable='true'][aria-label*='message' i]",
+    "div[role='textbox'][contenteditable='true'][aria-label*='הודעה']",
+    "div.msg-form__contenteditable[contenteditable='true']",
+    "div.msg-form__msg-content-container div[contenteditable='true']",
+    "form.msg-form div[contenteditable='true']",
+    "div[role='textbox'][contenteditable='true']",
+    "div.msg-form__contenteditable p",
+)
+_MSG_SEND_BUTTON_SELECTOR = "button.msg-form__send-button[type='submit']"
+_SEND_SELECTORS = (
+    _MSG_SEND_BUTTON_SELECTOR,
+    "button[type='submit']:has-text('Send')",
+    "button[type='submit']:has-text('שלח')",
+    "button[aria-label='Send' i]",
+    "button[aria-label*='שלח']",
+)
+
+# Requests blocked while scraping (images, video, fonts). Stylesheets are kept:
+# visibility checks depend on layout.
+_SCRAPE_BLOCKED_URLS = [
+    "*/dms/image/*",
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp",
+    "*.mp4", "*.webm",
+    "*.woff", "*.woff2", "*.ttf",
+]
+
+_CLOSE_OVERLAY_SELECTORS = (
+    "button[data-control-name='overlay.close_conversation_window']",
+    ".msg-overlay-bubble-header__control--close-btn",
+    "button.msg-overlay-bubble-header__control",
+)
+
+# Finds the profile's own Message button (English "Message" / Hebrew "הודעה")
+# inside <main>, skipping messaging overlays, and clicks it in the same
+# round-trip. Returns true if a button was clicked.
+_CLICK_PROFILE_MESSAGE_BUTTON_JS = """
+    () => {
+        const mainEl = document.querySelector('main');
+        if (!mainEl) return false;
+        const candidates = mainEl.querySelectorAll('button, a');
+        for (const el of candidates) {
+            const text = el.textContent.trim();
+            if (!/^\\s*(Message|הודעה)\\s*$/i.test(text)) continue;
+            const rect = el.getBoundingClientRect();
+            if (rect.width === 0 || rect.height === 0) continue;
+            if (el.closest('.msg-overlay-list-bubble') ||
+                el.closest('.msg-overlay-bubble-header') ||
+                el.closest('.msg-overlay-conversation-bubble') ||
+                el.closest('aside')) continue;
+            el.scrollIntoView({block: 'center'});
+            el.click();
+            return true;
+        }
+        return false;
+    }
+"""
+
+# Scrolls the connections list from inside the page. Each step scrolls to the
+# bottom, clicks "Load more" if shown, then waits until no DOM mutation has
+# happened for quietMs (capped at maxWaitMs). Stops after maxQuiet steps that
+# add no /in/ links ("done"), after maxSteps, or when sliceMs has elapsed so the
+# caller can report progress and call again (passing back the quiet count).
+_AUTO_SCROLL_JS = """
+    async ({quietMs, maxWaitMs, maxQuiet, sliceMs, maxSteps, quiet}) => {
+        const count = () => document.querySelectorAll('a[href*="/in/"]').length;
+        const settle = () => new Promise(resolve => {
+            let timer;
+            const finish = () => { observer.disconnect(); clearTimeout(timer); clearTimeout(cap); resolve(); };
+            const observer = new MutationObserver(() => {
+                clearTimeout(timer);
+                timer = setTimeout(finish, quietMs);
+            });
+            observer.observe(document.body, {childList: true, subtree: true});
+            timer = setTimeout(finish, quietMs);
+            const cap = setTimeout(finish, maxWaitMs);
+        });
+
+        const start = performance.now();
+        let steps = 0;
+        while (steps < maxSteps && performance.now() - start < sliceMs) {
+            const before = count();
+            window.scrollTo(0, document.body.scrollHeight);
+            const loadMore = Array.from(document.querySelectorAll('button'))
+                .find(b => /^\\s*Load more\\s*$/i.test(b.textContent));
+            if (loadMore) loadMore.click();
+            await settle();
+            steps++;
+            if (count() > before) {
+                quiet = 0;
+            } else if (++quiet >= maxQuiet) {
+                return {count: count(), steps, quiet, done: true};
+            }
+        }
+        return {count: count(), steps, quiet, done: false};
+    }
+"""
+
+
+def wait_for_first_visible(
+    page: Page, selectors: tuple[Union[str, Locator], ...], timeout: int = 3000, last: bool = False
+) -> Optional[Locator]:
+    """Wait once for any of the selectors to become visible, then return the
+    visible match of the highest-priority selector (earliest in the list).
+
+    Selectors may be CSS strings or Locators (e.g. get_by_role fallbacks).
+    The candidates are raced in a single locator.or_() wait, so a miss costs
+    one timeout instead of one per selector. With last=True the last visible
+    match of the chosen selector is returned (newest message overlay).
+    """
+    visible = [
+        page.locator(f"{sel} >> visible=true") if isinstance(sel, str) else sel.locator("visible=true")
+        for sel in selectors
+    ]
+    combined = visible[0]
+    for loc in visible[1:]:
+        combined = combined.or_(loc)
+    try:
+        combined.first.wait_for(state="attached", timeout=timeout)
+    except Exception:
+        return None
+
+    for sel, loc in zip(selectors, visible):
+        try:
+            if loc.count() > 0:
+                logger.debug(f"Matched selector: {sel}")
+                return loc.last if last else loc.first
+        except Exception:
+            continue
+    return None
 
-from playwright.sync_api import Page
+
+def _is_logged_in_url(url: str) -> bool:
+    """True for a LinkedIn URL that isn't the login page or authwall."""
+    url = url.lower()
+    return "linkedin.com" in url and "login" not in url and "authwall" not in url
 
 
 class LinkedInAutomation:
     """All LinkedIn browser interactions via Playwright."""
 
+    # Default timeouts (ms). Playwright's own default of 30s per action made a
+    # missing element stall a prospect for half a minute.
+    TIMEOUT_NORMAL = 4000
+    TIMEOUT_NAVIGATION = 15000
+    TIMEOUT_UPLOAD = 120000
+
     def __init__(self, page: Page):
         self.page = page
         self.logger = logging.getLogger("minutely")
+        page.set_default_timeout(self.TIMEOUT_NORMAL)
+        page.set_default_navigation_timeout(self.TIMEOUT_NAVIGATION)
+
+        # Locators are lazy and bound to the page, so build the ones used on
+        # every profile once and reuse them.
+        self._connected_btns = (
+            page.locator("main button[aria-label^='Message' i], main button:text-is('Message')").first,
+            page.get_by_role("button", name=_MESSAGE_NAME_RE).first,
+        )
+        self._pending_btns = (
+            page.locator("main button[aria-label*='Pending' i], main button:has-text('Pending')").first,
+            page.get_by_role("button", name=_PENDING_NAME_RE).first,
+        )
+        # Not narrowed with .first: wait_for_first_visible picks the first
+        # *visible* match itself
+        self._connect_btns = (
+            page.locator(
+                "main button[aria-label^='Invite'][aria-label*='connect' i], "
+                "main button:text-is('Connect')"
+            ),
+            page.get_by_role("button", name=_CONNECT_NAME_RE),
+        )
+        self._more_btn = page.get_by_role("button", name="More")
+        self._dialog = page.locator("div[role='dialog']").first
+        # Kept separate (not comma-joined): the last selector is a generic
+        # header control, so priority order matters.
+        self._close_overlay_btns = tuple(page.locator(sel) for sel in _CLOSE_OVERLAY_SELECTORS)
 
     def _screenshot_debug(self, label: str) -> None:
         """Take a debug screenshot and save to /tmp for diagnostics."""
@@ -34,24 +266,77 @@ class LinkedInAutomation:
         except Exception as e:
             self.logger.debug(f"Screenshot failed: {e}")
 
+    def _wait_for_first_visible(
+        self, selectors: tuple[Union[str, Locator], ...], timeout: int = 3000, last: bool = False
+    ) -> Optional[Locator]:
+        """wait_for_first_visible() on this page."""
+        return wait_for_first_visible(self.page, selectors, timeout=timeout, last=last)
+
+    def _wait_for_js(self, predicate: str, arg=None, timeout: int = 2000) -> bool:
+        """Wait for a JS predicate to become truthy. Returns False on timeout
+        instead of raising, for use as a settle step."""
+        try:
+            self.page.wait_for_function(predicate, arg=arg, timeout=timeout)
+            return True
+        except Exception:
+            return False
+
+    def _wait_for_cleared(self, message_box: Locator, timeout: int = 3000) -> None:
+        """Wait for LinkedIn to clear the message box after Send.
+
+        Runs after the click, when the message may already be out: a box
+        that was detached or hidden instead only gets a debug log, never an
+        exception that would report the send as failed.
+        """
+        try:
+            expect(message_box).to_have_text(_CLEARED_TEXT_RE, use_inner_text=True, timeout=timeout)
+        except Exception as e:
+            self.logger.debug(f"Message box not seen cleared: {e}")
+
+    @contextmanager
+    def _block_heavy_resources(self):
+        """Block image/media/font downloads for the duration of a scrape.
+
+        Uses CDP Network.setBlockedURLs rather than page.route(), which would
+        disable the HTTP cache for LinkedIn's script bundles. Chromium only; on
+        any CDP error the scrape simply runs unblocked.
+        """
+        client = None
+        try:
+            client = self.page.context.new_cdp_session(self.page)
+            client.send("Network.enable")
+            client.send("Network.setBlockedURLs", {"urls": _SCRAPE_BLOCKED_URLS})
+        except Exception as e:
+            self.logger.debug(f"Resource blocking unavailable: {e}")
+        try:
+            yield
+        finally:
+            if client is not None:
+                try:
+                    client.send("Network.setBlockedURLs", {"urls": []})
+                    client.detach()
+                except Exception:
+                    pass
+
     # --- Navigation ---
 
     def navigate_to_profile(self, url: str) -> bool:
         """Navigate to a LinkedIn profile URL. Returns True if successful."""
         try:
             self.logger.info(f"Navigating to {url}")
-            self.page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            self.page.goto(url, wait_until="domcontentloaded")
 
-            current_url = self.page.url.lower()
-            self.logger.info(f"After goto, current URL: {self.page.url}")
+            page_url = self.page.url
+            current_url = page_url.lower()
+            self.logger.info(f"After goto, current URL: {page_url}")
 
-            if "linkedin.com/login" in current_url or "linkedin.com/authwall" in current_url:
+            if any(term in current_url for term in _LOGIN_URL_TERMS):
                 self.logger.error("Redirected to login page. Session may have expired.")
                 self._screenshot_debug("nav_login_redirect")
                 return False
 
-            if any(term in current_url for term in ["checkpoint", "challenge", "security"]):
-                self.logger.error(f"Security page detected during navigation: {self.page.url}")
+            if any(term in current_url for term in _SECURITY_URL_TERMS):
+                self.logger.error(f"Security page detected during navigation: {page_url}")
                 self._screenshot_debug("nav_security_challenge")
                 return False
 
@@ -59,7 +344,7 @@ class LinkedInAutomation:
                 not_found = self.page.locator(
                     "text=/page doesn.*t exist|profile.*not found/i"
                 )
-                if not_found.is_visible(timeout=3000):
+                if not_found.is_visible():
                     self.logger.error(f"Profile not found: {url}")
                     self._screenshot_debug("nav_profile_not_found")
                     return False
@@ -78,11 +363,16 @@ class LinkedInAutomation:
         """Verify we are logged into LinkedIn."""
         try:
             try:
-                self.page.wait_for_load_state("domcontentloaded", timeout=15000)
+                self.page.wait_for_load_state("domcontentloaded", timeout=self.TIMEOUT_NAVIGATION)
             except Exception:
                 pass
 
-            time.sleep(5)
+            # Returns as soon as we land on a logged-in page; on the login page
+            # this waits out the timeout in case a redirect is still pending.
+            try:
+                self.page.wait_for_url(_is_logged_in_url, timeout=5000)
+            except Exception:
+                pass
             current_url = self.page.url.lower()
             self.logger.debug(f"Current URL after login: {current_url}")
 
@@ -98,9 +388,11 @@ class LinkedInAutomation:
             self.page.goto(
                 "https://www.linkedin.com/feed/",
                 wait_until="domcontentloaded",
-                timeout=30000,
             )
-            time.sleep(5)
+            try:
+                self.page.wait_for_url(_is_logged_in_url, timeout=5000)
+            except Exception:
+                pass
 
             current_url = self.page.url.lower()
             if "login" in current_url or "authwall" in current_url:
@@ -127,18 +419,17 @@ class LinkedInAutomation:
             self.page.goto(
                 "https://www.linkedin.com/in/me/",
                 wait_until="domcontentloaded",
-                timeout=15000,
             )
 
             # Strategy 1: Wait for LinkedIn to redirect /in/me/ to /in/<actual-id>/
             # LinkedIn can take 15-20+ seconds to redirect
             try:
                 self.page.wait_for_url(
-                    re.compile(r"/in/(?!me(/|$))"),  # URL contains /in/ NOT followed by "me"
+                    _NOT_ME_PROFILE_URL_RE,
                     timeout=30000,
                 )
                 current_url = self.page.url
-                match = re.search(r"/in/([^/?#]+)", current_url)
+                match = _PROFILE_ID_RE.search(current_url)
                 if match:
                     profile_id = match.group(1)
                     self.logger.info(f"Detected logged-in user: {profile_id}")
@@ -148,7 +439,7 @@ class LinkedInAutomation:
 
             # Strategy 2: Check current URL one more time (redirect may have just completed)
             current_url = self.page.url
-            match = re.search(r"/in/([^/?#]+)", current_url)
+            match = _PROFILE_ID_RE.search(current_url)
             if match and match.group(1) != "me":
                 profile_id = match.group(1)
                 self.logger.info(f"Detected logged-in user (late redirect): {profile_id}")
@@ -161,7 +452,7 @@ class LinkedInAutomation:
                     profile_link = self.page.query_selector('.global-nav a[href*="/in/"]')
                 if profile_link:
                     href = profile_link.get_attribute("href") or ""
-                    match = re.search(r"/in/([^/?#]+)", href)
+                    match = _PROFILE_ID_RE.search(href)
                     if match and match.group(1) != "me":
                         profile_id = match.group(1)
                         self.logger.info(f"Detected logged-in user from nav: {profile_id}")
@@ -180,7 +471,7 @@ class LinkedInAutomation:
     def detect_security_challenge(self) -> bool:
         """Check if LinkedIn is showing a CAPTCHA or security verification."""
         current_url = self.page.url.lower()
-        if any(term in current_url for term in ["checkpoint", "challenge", "security"]):
+        if any(term in current_url for term in _SECURITY_URL_TERMS):
             self.logger.critical("Security challenge detected in URL!")
             return True
 
@@ -188,7 +479,7 @@ class LinkedInAutomation:
             challenge_text = self.page.locator(
                 "text=/verify.*identity|security.*verification|unusual.*activity/i"
             )
-            if challenge_text.is_visible(timeout=2000):
+            if challenge_text.is_visible():
                 self.logger.critical("Security challenge detected on page!")
                 return True
         except Exception:
@@ -210,9 +501,14 @@ class LinkedInAutomation:
             for selector in see_more_selectors:
                 try:
                     btn = self.page.locator(selector)
-                    if btn.is_visible(timeout=2000):
+                    if btn.is_visible():
                         btn.click()
-                        time.sleep(1)
+                        # Expanded once the "see more" toggle is gone; don't
+                        # fall through to the next selector and click it again
+                        try:
+                            btn.wait_for(state="hidden", timeout=3000)
+                        except Exception:
+                            pass
                         break
                 except Exception:
                     continue
@@ -227,23 +523,20 @@ class LinkedInAutomation:
 
         for selector in selectors:
             try:
-                elements = self.page.locator(selector)
-                if elements.count() > 0:
-                    texts = []
-                    for i in range(elements.count()):
-                        text = elements.nth(i).inner_text().strip()
-                        if text and len(text) > 10:
-                            texts.append(text)
-                    if texts:
-                        about = " ".join(texts)
-                        self.logger.debug(f"About section scraped ({len(about)} chars)")
-                        return about
+                # One round-trip for all matches; empty selector yields []
+                texts = self.page.locator(selector).evaluate_all(
+                    "els => els.map(e => (e.innerText || '').trim()).filter(t => t.length > 10)"
+                )
+                if texts:
+                    about = " ".join(texts)
+                    self.logger.debug(f"About section scraped ({len(about)} chars)")
+                    return about
             except Exception:
                 continue
 
         try:
             about_heading = self.page.get_by_text("About", exact=True).first
-            if about_heading.is_visible(timeout=2000):
+            if about_heading.is_visible():
                 section = about_heading.locator("xpath=ancestor::section")
                 text = section.inner_text().replace("About", "", 1).strip()
                 if text:
@@ -269,16 +562,13 @@ class LinkedInAutomation:
 
         for selector in experience_selectors:
             try:
-                items = self.page.locator(selector)
-                if items.count() > 0:
-                    texts = []
-                    for i in range(min(items.count(), 5)):
-                        text = items.nth(i).inner_text().strip()
-                        if text:
-                            texts.append(text)
-                    if texts:
-                        experience_text = "\n".join(texts)
-                        break
+                texts = self.page.locator(selector).evaluate_all(
+                    "(els, n) => els.slice(0, n).map(e => (e.innerText || '').trim()).filter(Boolean)",
+                    5,
+                )
+                if texts:
+                    experience_text = "\n".join(texts)
+                    break
             except Exception:
                 continue
 
@@ -291,7 +581,7 @@ class LinkedInAutomation:
         for selector in company_selectors:
             try:
                 el = self.page.locator(selector).first
-                if el.is_visible(timeout=2000):
+                if el.is_visible():
                     text = el.inner_text().strip()
                     if text and len(text) > 1:
                         company_name = text.split("·")[0].strip()
@@ -329,25 +619,24 @@ class LinkedInAutomation:
 
     # --- Connection Status Check ---
 
+    def _find_button(self, candidates: tuple) -> Optional[Locator]:
+        """Return the first visible locator among (CSS, role fallback) candidates,
+        or None if neither is visible."""
+        for candidate in candidates:
+            try:
+                if candidate.is_visible():
+                    return candidate
+            except Exception:
+                continue
+        return None
+
     def is_connected(self) -> bool:
         """Check if we are already connected with the person."""
-        try:
-            msg_btn = self.page.get_by_role(
-                "button", name=re.compile(r"^Message$", re.I)
-            )
-            return msg_btn.is_visible(timeout=3000)
-        except Exception:
-            return False
+        return self._find_button(self._connected_btns) is not None
 
     def is_pending(self) -> bool:
         """Check if a connection request is already pending."""
-        try:
-            pending = self.page.get_by_role(
-                "button", name=re.compile(r"Pending", re.I)
-            )
-            return pending.is_visible(timeout=3000)
-        except Exception:
-            return False
+        return self._find_button(self._pending_btns) is not None
 
     # --- Connection Request ---
 
@@ -364,66 +653,56 @@ class LinkedInAutomation:
             self.logger.info("Connection request already pending.")
             return "AlreadyPending"
 
-        # Step 1: Find and click Connect button
+        # Step 1: Find and click Connect button. Its CSS and role variants
+        # are raced in one wait; "More" is on every profile, so the dropdown
+        # is only tried once the primary button has missed.
         connect_clicked = False
 
         try:
-            connect_btn = self.page.get_by_role(
-                "button", name=re.compile(r"^Connect$", re.I)
-            )
-            if connect_btn.is_visible(timeout=3000):
+            connect_btn = self._wait_for_first_visible(self._connect_btns)
+            if connect_btn is not None:
                 connect_btn.click()
                 connect_clicked = True
                 self.logger.debug("Clicked primary Connect button.")
-        except Exception:
-            pass
-
-        if not connect_clicked:
-            try:
-                more_btn = self.page.get_by_role("button", name="More")
-                if more_btn.is_visible(timeout=3000):
+            else:
+                more_btn = self._wait_for_first_visible((self._more_btn,))
+                if more_btn is not None:
                     more_btn.click()
-                    time.sleep(1)
-                    connect_item = self.page.get_by_role(
-                        "menuitem", name=re.compile(r"Connect", re.I)
+                    connect_item = self._wait_for_first_visible(
+                        (self.page.get_by_role("menuitem", name=_CONNECT_MENU_RE),)
                     )
-                    if connect_item.is_visible(timeout=3000):
+                    if connect_item is not None:
                         connect_item.click()
                         connect_clicked = True
                         self.logger.debug("Clicked Connect via More dropdown.")
-            except Exception:
-                pass
+        except Exception:
+            pass
 
         if not connect_clicked:
             self.logger.error("Could not find Connect button on profile.")
             return "Error"
 
         # Step 2: Handle the connection modal
-        time.sleep(2)
+        try:
+            self._dialog.wait_for(state="visible", timeout=5000)
+        except Exception:
+            self.logger.debug("Connection modal did not appear within 5s.")
 
         note_sent = False
         try:
             add_note_btn = self.page.get_by_role(
-                "button", name=re.compile(r"Add a note", re.I)
+                "button", name=_ADD_NOTE_NAME_RE
             )
-            if add_note_btn.is_visible(timeout=3000):
+            if add_note_btn.is_visible():
                 add_note_btn.click()
-                time.sleep(1)
-
-                textarea = None
-                textarea_selectors = [
-                    "#custom-message",
-                    "textarea[name='message']",
-                    "textarea",
-                ]
-                for sel in textarea_selectors:
-                    try:
-                        el = self.page.locator(sel)
-                        if el.is_visible(timeout=2000):
-                            textarea = el
-                            break
-                    except Exception:
-                        continue
+
+                # The modal has a single note field, so one CSS union is enough
+                # (no per-selector priority pass needed)
+                textarea = self.page.locator(f"{_NOTE_TEXTAREA_SELECTOR} >> visible=true").first
+                try:
+                    textarea.wait_for(state="attached", timeout=2000)
+                except Exception:
+                    textarea = None
 
                 if textarea is None:
                     try:
@@ -443,11 +722,15 @@ class LinkedInAutomation:
         # Step 3: Click Send
         try:
             send_btn = self.page.get_by_role(
-                "button", name=re.compile(r"^Send", re.I)
+                "button", name=_SEND_PREFIX_RE
+            )
+            modal_send = self.page.locator(
+                "div[role='dialog'] button:has-text('Send')"
             )
-            if send_btn.is_visible(timeout=5000):
-                send_btn.click()
-                time.sleep(2)
+            clicked = self._wait_for_first_visible((send_btn, modal_send), timeout=5000)
+            if clicked is not None:
+                clicked.click()
+                self._wait_for_dialog_closed()
                 if note_sent:
                     self.logger.info("Connection request sent WITH note.")
                 else:
@@ -456,21 +739,16 @@ class LinkedInAutomation:
         except Exception:
             pass
 
+        self.logger.error("Failed to click Send on the connection modal.")
+        return "Error"
+
+    def _wait_for_dialog_closed(self, timeout: int = 5000) -> None:
+        """Wait for the connection modal to close after clicking Send."""
         try:
-            modal_send = self.page.locator(
-                "div[role='dialog'] button:has-text('Send')"
-            )
-            if modal_send.is_visible(timeout=3000):
-                modal_send.click()
-                time.sleep(2)
-                self.logger.info("Connection request sent (fallback send button).")
-                return "ConnectionSent"
+            self._dialog.wait_for(state="hidden", timeout=timeout)
         except Exception:
             pass
 
-        self.logger.error("Failed to click Send on the connection modal.")
-        return "Error"
-
     # --- Video Attachment ---
 
     def attach_video(self, video_path: Path) -> bool:
@@ -478,17 +756,14 @@ class LinkedInAutomation:
         self.logger.info(f"Attaching video: {video_path} (exists={video_path.exists()}, size={video_path.stat().st_size if video_path.exists() else 'N/A'})")
 
         file_set = False
+        video_file = str(video_path)
 
         # Strategy 1: Set file directly on hidden input[type="file"]
         # LinkedIn has a hidden file input in the message form -- setting files
         # directly bypasses the button click and file chooser dialog entirely.
         try:
-            file_input = self.page.locator(
-                '.msg-overlay-conversation-bubble input[type="file"], '
-                '.msg-form input[type="file"], '
-                'input[type="file"]'
-            ).first
-            file_input.set_input_files(str(video_path))
+            file_input = self.page.locator(_FILE_INPUT_SELECTOR).first
+            file_input.set_input_files(video_file)
             file_set = True
             self.logger.debug("Video file set via direct input[type='file'].")
         except Exception as e:
@@ -496,32 +771,14 @@ class LinkedInAutomation:
 
         # Strategy 2: Click attachment button → file chooser
         if not file_set:
-            attach_btn = None
-            attach_selectors = [
-                "button[aria-label*='Attach' i]",
-                "button[aria-label*='file' i]",
-                "button[aria-label*='צרף']",
-                "button[aria-label*='קובץ']",
-                ".msg-form__footer-action button[aria-label*='Attach' i]",
-                ".msg-form__left-actions button[aria-label*='Attach' i]",
-                "button[data-control-name*='attach' i]",
-                ".msg-form__left-actions button",
-            ]
-
-            for sel in attach_selectors:
-                try:
-                    el = self.page.locator(sel).first
-                    if el.is_visible(timeout=2000):
-                        attach_btn = el
-                        self.logger.debug(f"Found attachment button: {sel}")
-                        break
-                except Exception:
-                    continue
+            attach_btn = self._wait_for_first_visible(_ATTACH_SELECTORS, timeout=2000)
 
-            # JavaScript fallback: search buttons in message overlay
+            # JavaScript fallback: search buttons in message overlay. The match
+            # is tagged with a data attribute and clicked through a locator, so
+            # no ElementHandle is kept alive.
             if attach_btn is None:
                 try:
-                    attach_handle = self.page.evaluate_handle("""
+                    found = self.page.evaluate("""
                         () => {
                             const areas = document.querySelectorAll(
                                 '.msg-form, .msg-overlay-conversation-bubble, [class*="msg-form"]'
@@ -532,15 +789,18 @@ class LinkedInAutomation:
                                     if (label.includes('attach') || label.includes('file') ||
                                         label.includes('צרף') || label.includes('קובץ')) {
                                         const r = btn.getBoundingClientRect();
-                                        if (r.width > 0 && r.height > 0) return btn;
+                                        if (r.width > 0 && r.height > 0) {
+                                            btn.setAttribute('data-minutely-attach', '');
+                                            return true;
+                                        }
                                     }
                                 }
                             }
-                            return null;
+                            return false;
                         }
                     """)
-                    if attach_handle and attach_handle.as_element():
-                        attach_btn = attach_handle.as_element()
+                    if found:
+                        attach_btn = self.page.locator("button[data-minutely-attach]").last
                         self.logger.debug("Found attachment button via JavaScript.")
                 except Exception:
                     pass
@@ -554,7 +814,7 @@ class LinkedInAutomation:
                 with self.page.expect_file_chooser(timeout=10000) as fc_info:
                     attach_btn.click()
                 file_chooser = fc_info.value
-                file_chooser.set_files(str(video_path))
+                file_chooser.set_files(video_file)
                 file_set = True
                 self.logger.debug("Video file set in file chooser.")
             except Exception as e:
@@ -562,40 +822,39 @@ class LinkedInAutomation:
                 return False
 
         # Wait for upload to complete.
-        # LinkedIn disables the Send button while uploading. We wait until
-        # the Send button becomes enabled again. Timeout: 120 seconds.
-        # Initial delay: give LinkedIn time to register the file and disable
-        # the Send button before we start checking (otherwise we might see
-        # Send enabled from the message text and return immediately).
-        time.sleep(3)
+        # LinkedIn disables the Send button while uploading and re-enables it
+        # once the upload finishes. First give it up to 3s to register the
+        # file and disable Send (otherwise we might see Send enabled from the
+        # message text and return immediately), then wait in-browser for Send
+        # to become enabled again. Timeout: 120 seconds.
+        send_selector = _MSG_SEND_BUTTON_SELECTOR
+        try:
+            self.page.wait_for_function(
+                "sel => { const b = document.querySelector(sel); return !!b && b.disabled; }",
+                arg=send_selector,
+                timeout=3000,
+            )
+        except Exception:
+            pass
         self.logger.debug("Waiting for video upload to complete...")
-        upload_complete = False
+        started = time.time()
 
-        for attempt in range(60):  # 60 × 2s = 120 seconds max
-            # Primary check: Send button becomes enabled after upload finishes
-            try:
-                send_btn = self.page.locator(
-                    "button.msg-form__send-button[type='submit']"
-                ).first
-                if send_btn.is_visible(timeout=500) and not send_btn.is_disabled():
-                    self.logger.info(
-                        f"Video upload complete (Send enabled after ~{attempt * 2}s)."
-                    )
-                    upload_complete = True
-                    break
-            except Exception:
-                pass
-
-            if attempt % 10 == 9:
-                self.logger.debug(
-                    f"Still waiting for video upload... ({(attempt + 1) * 2}s)"
-                )
-
-            time.sleep(2)
-
-        if upload_complete:
+        try:
+            self.page.wait_for_function(
+                """sel => {
+                    const b = document.querySelector(sel);
+                    if (!b || b.disabled) return false;
+                    const r = b.getBoundingClientRect();
+                    return r.width > 0 && r.height > 0;
+                }""",
+                arg=send_selector,
+                timeout=self.TIMEOUT_UPLOAD,
+            )
+            self.logger.info(
+                f"Video upload complete (Send enabled after ~{round(time.time() - started)}s)."
+            )
             return True
-        else:
+        except Exception:
             self.logger.warning(
                 "Video upload did not complete within 120s. "
                 "Send button may still be disabled."
@@ -610,102 +869,81 @@ class LinkedInAutomation:
         Optionally attaches a video file.
         """
         # Step 1: Click the correct Message button
+        # Wait for the profile's action buttons rather than network idle;
+        # LinkedIn's telemetry beacons keep the network busy long after the
+        # page is interactive.
         try:
-            self.page.wait_for_load_state("networkidle", timeout=5000)
+            self.page.wait_for_load_state("domcontentloaded", timeout=5000)
+            self.page.locator(
+                "main button:has-text('Message'), main a:has-text('Message'), "
+                "main button:has-text('הודעה'), main a:has-text('הודעה')"
+            ).first.wait_for(state="visible", timeout=5000)
         except Exception:
             pass
-        time.sleep(1)
 
-        msg_btn = None
+        # Find and click the Message button in one round-trip
+        clicked = False
         try:
-            # Search for Message button - supports English ("Message") and Hebrew ("הודעה")
-            msg_handle = self.page.evaluate_handle("""
-                () => {
-                    const mainEl = document.querySelector('main');
-                    if (!mainEl) return null;
-                    const candidates = mainEl.querySelectorAll('button, a');
-                    for (const el of candidates) {
-                        const text = el.textContent.trim();
-                        if (!/^\\s*(Message|הודעה)\\s*$/i.test(text)) continue;
-                        const rect = el.getBoundingClientRect();
-                        if (rect.width === 0 || rect.height === 0) continue;
-                        if (el.closest('.msg-overlay-list-bubble') ||
-                            el.closest('.msg-overlay-bubble-header') ||
-                            el.closest('.msg-overlay-conversation-bubble') ||
-                            el.closest('aside')) continue;
-                        return el;
-                    }
-                    return null;
-                }
-            """)
-
-            if msg_handle and msg_handle.as_element():
-                msg_btn = msg_handle.as_element()
-                self.logger.debug("Message button found via JavaScript (inside <main>).")
+            clicked = bool(self.page.evaluate(_CLICK_PROFILE_MESSAGE_BUTTON_JS))
+            if clicked:
+                self.logger.debug("Message button clicked via JavaScript (inside <main>).")
             else:
                 self.logger.debug("JS method didn't find button, trying Playwright selectors...")
-
         except Exception as e:
             self.logger.debug(f"JS button search failed: {e}")
 
-        if msg_btn is None:
-            fallback_selectors = [
-                "main button:has-text('Message')",
-                "main a:has-text('Message')",
-                "main button:has-text('הודעה')",
-                "main a:has-text('הודעה')",
-            ]
-            for sel in fallback_selectors:
+        msg_btn = None
+        if not clicked:
+            for sel in _MESSAGE_BUTTON_SELECTORS:
                 try:
                     candidate = self.page.locator(sel).first
-                    if candidate.is_visible(timeout=2000):
+                    if candidate.is_visible():
                         msg_btn = candidate
                         self.logger.debug(f"Message button found via fallback: {sel}")
                         break
                 except Exception:
                     continue
 
-        # Last resort: try aria-label based detection
-        if msg_btn is None:
-            try:
-                candidate = self.page.locator("main button[aria-label*='message' i], main button[aria-label*='הודעה']").first
-                if candidate.is_visible(timeout=2000):
-                    msg_btn = candidate
-                    self.logger.debug("Message button found via aria-label.")
-            except Exception:
-                pass
+            # Last resort: try aria-label based detection
+            if msg_btn is None:
+                try:
+                    candidate = self.page.locator("main button[aria-label*='message' i], main button[aria-label*='הודעה']").first
+                    if candidate.is_visible():
+                        msg_btn = candidate
+                        self.logger.debug("Message button found via aria-label.")
+                except Exception:
+                    pass
 
-        if msg_btn is None:
-            self.logger.error("Message button not found. May not be connected.")
-            self._screenshot_debug("no_msg_button")
-            return False
+            if msg_btn is None:
+                self.logger.error("Message button not found. May not be connected.")
+                self._screenshot_debug("no_msg_button")
+                return False
 
         try:
-            msg_btn.click()
-            time.sleep(2)
+            if msg_btn is not None:
+                msg_btn.click()
             self.logger.debug("Message button clicked. Waiting for conversation to load...")
+            try:
+                self.page.locator(
+                    ".msg-form, .msg-overlay-conversation-bubble, .msg-connections-typeahead-container"
+                ).first.wait_for(state="visible", timeout=5000)
+            except Exception:
+                pass
 
             try:
                 typeahead = self.page.locator(".msg-connections-typeahead-container")
-                if typeahead.is_visible(timeout=1000):
+                if typeahead.is_visible():
                     self.logger.debug("Typeahead visible. Waiting for it to auto-resolve...")
-                    for i in range(5):
-                        time.sleep(0.5)
-                        try:
-                            if not typeahead.is_visible(timeout=300):
-                                self.logger.debug(f"Typeahead disappeared after {i+1}s.")
-                                break
-                        except Exception:
-                            self.logger.debug(f"Typeahead gone after {i+1}s.")
-                            break
-                    else:
+                    try:
+                        typeahead.wait_for(state="hidden", timeout=2500)
+                        self.logger.debug("Typeahead disappeared.")
+                    except Exception:
                         self.logger.debug("Typeahead persists. Clicking message body...")
                         try:
                             body = self.page.locator(
                                 "div[role='textbox'][contenteditable='true']"
                             ).last
                             body.click(force=True)
-                            time.sleep(0.5)
                         except Exception:
                             pass
             except Exception:
@@ -716,27 +954,7 @@ class LinkedInAutomation:
             return False
 
         # Step 2: Find message input box
-        message_box = None
-        msg_box_selectors = [
-            "div[role='textbox'][contenteditable='true'][aria-label*='Write a message' i]",
-            "div[role='textbox'][contenteditable='true'][aria-label*='message' i]",
-            "div[role='textbox'][contenteditable='true'][aria-label*='הודעה']",
-            "div.msg-form__contenteditable[contenteditable='true']",
-            "div.msg-form__msg-content-container div[contenteditable='true']",
-            "form.msg-form div[contenteditable='true']",
-            "div[role='textbox'][contenteditable='true']",
-            "div.msg-form__contenteditable p",
-        ]
-
-        for sel in msg_box_selectors:
-            try:
-                el = self.page.locator(sel).last
-                if el.is_visible(timeout=3000):
-                    message_box = el
-                    self.logger.debug(f"Message box found via: {sel}")
-                    break
-            except Exception:
-                continue
+        message_box = self._wait_for_first_visible(_MSG_BOX_SELECTORS, timeout=3000, last=True)
 
         if message_box is None:
             self.logger.error("Could not find message input box.")
@@ -747,12 +965,11 @@ class LinkedInAutomation:
         # Step 3: Type the message
         try:
             message_box.click(force=True)
-            time.sleep(0.3)
-            # Clear any existing content
+            # Clear any existing content, then wait until the focused editor
+            # is actually empty (replaces fixed settle sleeps)
             self.page.keyboard.press("Control+a")
-            time.sleep(0.1)
             self.page.keyboard.press("Delete")
-            time.sleep(0.2)
+            self._wait_for_js(_EDITOR_EMPTY_JS, timeout=2000)
             # Use execCommand('insertText') which properly integrates with
             # contenteditable editors by dispatching beforeinput + input events.
             # Previous approaches that failed:
@@ -771,7 +988,7 @@ class LinkedInAutomation:
                     if i > 0:
                         self.page.keyboard.press("Shift+Enter")
                     self.page.keyboard.type(line, delay=5)
-            time.sleep(0.5)
+            self._wait_for_js(_EDITOR_FILLED_JS, timeout=2000)
             self.logger.debug(f"Typed message ({len(message)} chars).")
         except Exception as e:
             self.logger.error(f"Failed to type message: {e}")
@@ -784,23 +1001,14 @@ class LinkedInAutomation:
                 self.logger.warning(
                     "Video attachment failed, but sending text message anyway."
                 )
-            time.sleep(1)
 
-        # Step 4: Click Send
-        time.sleep(0.5)
+        # Step 4: Click Send (a disabled button is waited on below)
         try:
             send_btn = None
-            send_selectors = [
-                "button.msg-form__send-button[type='submit']",
-                "button[type='submit']:has-text('Send')",
-                "button[type='submit']:has-text('שלח')",
-                "button[aria-label='Send' i]",
-                "button[aria-label*='שלח']",
-            ]
-            for sel in send_selectors:
+            for sel in _SEND_SELECTORS:
                 try:
                     candidate = self.page.locator(sel).first
-                    if candidate.is_visible(timeout=2000):
+                    if candidate.is_visible():
                         send_btn = candidate
                         self.logger.debug(f"Send button found via: {sel}")
                         break
@@ -810,7 +1018,7 @@ class LinkedInAutomation:
             if send_btn is None:
                 try:
                     send_btn = self.page.get_by_role(
-                        "button", name=re.compile(r"^(Send|שלח)$", re.I)
+                        "button", name=_SEND_NAME_RE
                     ).first
                 except Exception:
                     pass
@@ -824,23 +1032,21 @@ class LinkedInAutomation:
             is_disabled = send_btn.is_disabled()
             if is_disabled:
                 self.logger.debug("Send button is disabled. Waiting for it to enable...")
-                for _ in range(10):
-                    time.sleep(0.5)
-                    if not send_btn.is_disabled():
-                        self.logger.debug("Send button is now enabled.")
-                        break
-                else:
+                try:
+                    expect(send_btn).to_be_enabled(timeout=5000)
+                    self.logger.debug("Send button is now enabled.")
+                except Exception:
                     self.logger.warning(
                         "Send button still disabled after 5s. Clicking with force=True..."
                     )
 
             send_btn.click(force=True)
-            time.sleep(1.5)
+            self._wait_for_cleared(message_box)
 
             # Verify message was actually sent by checking if the input was cleared.
             # LinkedIn clears the message box after a successful send.
             try:
-                remaining = message_box.inner_text().strip()
+                remaining = message_box.inner_text(timeout=1000).strip()
                 if len(remaining) > 20:
                     self.logger.warning(
                         f"Message input not cleared after Send ({len(remaining)} chars remain). "
@@ -848,9 +1054,8 @@ class LinkedInAutomation:
                     )
                     # Retry with Enter key (LinkedIn's default send shortcut)
                     message_box.click(force=True)
-                    time.sleep(0.2)
                     self.page.keyboard.press("Enter")
-                    time.sleep(1.5)
+                    self._wait_for_cleared(message_box)
             except Exception:
                 pass  # message_box may no longer be valid after overlay change
 
@@ -867,34 +1072,22 @@ class LinkedInAutomation:
     def check_for_reply(self) -> bool:
         """Check if there is a reply from the prospect in the messaging window."""
         try:
-            msg_handle = self.page.evaluate_handle("""
-                () => {
-                    const mainEl = document.querySelector('main');
-                    if (!mainEl) return null;
-                    const candidates = mainEl.querySelectorAll('button, a');
-                    for (const el of candidates) {
-                        const text = el.textContent.trim();
-                        if (!/^\\s*(Message|הודעה)\\s*$/i.test(text)) continue;
-                        const rect = el.getBoundingClientRect();
-                        if (rect.width === 0 || rect.height === 0) continue;
-                        if (el.closest('.msg-overlay-list-bubble') ||
-                            el.closest('.msg-overlay-bubble-header') ||
-                            el.closest('aside')) continue;
-                        return el;
-                    }
-                    return null;
-                }
-            """)
-            if not msg_handle or not msg_handle.as_element():
+            if not self.page.evaluate(_CLICK_PROFILE_MESSAGE_BUTTON_JS):
                 return False
-            msg_handle.as_element().click()
-            time.sleep(5)
+            try:
+                self.page.locator(
+                    "li.msg-s-message-list__event, div.msg-s-event-listitem"
+                ).first.wait_for(state="attached", timeout=5000)
+            except Exception:
+                pass
 
             messages = self.page.locator("li.msg-s-message-list__event")
-            if messages.count() == 0:
+            n = messages.count()
+            if n == 0:
                 messages = self.page.locator("div.msg-s-event-listitem")
+                n = messages.count()
 
-            if messages.count() == 0:
+            if n == 0:
                 self.logger.debug("No messages found in conversation.")
                 self._close_message_overlay()
                 return False
@@ -922,139 +1115,148 @@ class LinkedInAutomation:
             return False
 
     def _close_message_overlay(self) -> None:
-        """Close any open messaging overlay/modal."""
+        """Close any open messaging overlay/modal.
+
+        Escape closes the overlay in almost every case, so it goes first; the
+        close buttons are only tried if a dialog is still open afterwards.
+        """
         try:
-            close_selectors = [
-                "button[data-control-name='overlay.close_conversation_window']",
-                ".msg-overlay-bubble-header__control--close-btn",
-                "button.msg-overlay-bubble-header__control",
-            ]
-            for sel in close_selectors:
+            self.page.keyboard.press("Escape")
+            try:
+                self._dialog.wait_for(state="hidden", timeout=200)
+                return
+            except Exception:
+                pass
+            for btn in self._close_overlay_btns:
                 try:
-                    btn = self.page.locator(sel)
-                    if btn.is_visible(timeout=1000):
+                    if btn.is_visible():
                         btn.click()
                         return
                 except Exception:
                     continue
-            self.page.keyboard.press("Escape")
         except Exception:
             pass
 
     # --- Connection Scraping ---
 
-    def scrape_connections_list(self, max_scrolls: int = 600, progress_callback=None) -> list[dict]:
+    def scrape_connections_list(
+        self, max_scrolls: int = 600, progress_callback=None, skip_ids: Optional[set[str]] = None
+    ) -> Iterator[None]:
         """
         Navigate to LinkedIn connections page and scrape all connections.
         Uses JavaScript-based extraction since LinkedIn uses obfuscated CSS classes.
-        Returns list of dicts: {profile_url, full_name, title}
+        Images, video and fonts are not downloaded while scraping.
+
+        A generator: yields after each scroll slice (a few seconds) so the
+        caller can hand the thread to other work, and returns the list of
+        dicts {profile_url, full_name, title} (use `yield from`).
 
         Args:
             max_scrolls: Maximum scroll iterations (600 supports ~6000 connections)
             progress_callback: Optional callable(connections_found: int) called during scrolling
+            skip_ids: Profile IDs (the /in/<id>/ slug) to leave out of the result,
+                e.g. contacts already stored with complete data
         """
-        print(f"[SCRAPER] Navigating to connections page...")
+        with self._block_heavy_resources():
+            return (yield from self._scrape_connections_list(max_scrolls, progress_callback, skip_ids or set()))
+
+    def _scrape_connections_list(self, max_scrolls: int, progress_callback, skip_ids: set[str]) -> Iterator[None]:
+        self.logger.info("[SCRAPER] Navigating to connections page...")
         self.page.goto(
             "https://www.linkedin.com/mynetwork/invite-connect/connections/",
             wait_until="domcontentloaded",
+            timeout=30000,  # large list page, slower than a profile
         )
-        time.sleep(5)
-        print(f"[SCRAPER] Page loaded: {self.page.url}, title: {self.page.title()}")
-
-        # Debug: dump page structure to understand what LinkedIn renders
-        debug_info = self.page.evaluate("""() => {
-            const allLinks = document.querySelectorAll('a[href*="/in/"]');
-            const bodyText = document.body.innerText.substring(0, 500);
-            const allAnchors = document.querySelectorAll('a');
-            const sampleHrefs = Array.from(allAnchors).slice(0, 20).map(a => a.href);
-            return {
-                inLinks: allLinks.length,
-                totalAnchors: allAnchors.length,
-                bodySnippet: bodyText,
-                sampleHrefs: sampleHrefs,
-                scrollHeight: document.body.scrollHeight
-            };
-        }""")
-        print(f"[SCRAPER] Debug - /in/ links: {debug_info['inLinks']}, total anchors: {debug_info['totalAnchors']}, scrollHeight: {debug_info['scrollHeight']}")
-        print(f"[SCRAPER] Debug - body snippet: {debug_info['bodySnippet'][:300]}")
-        print(f"[SCRAPER] Debug - sample hrefs: {debug_info['sampleHrefs'][:10]}")
-
-        # Save debug screenshot
-        try:
-            import os
-            data_dir = os.environ.get("DATA_DIR", ".")
-            self.page.screenshot(path=f"{data_dir}/debug_connections_page.png")
-            print(f"[SCRAPER] Debug screenshot saved to {data_dir}/debug_connections_page.png")
-        except Exception as e:
-            print(f"[SCRAPER] Debug screenshot failed: {e}")
+        self.logger.debug(f"[SCRAPER] Page loaded: {self.page.url}")
 
         # Wait for connection cards to appear (LinkedIn lazy-loads them)
         try:
             self.page.wait_for_selector('a[href*="/in/"]', timeout=15000)
-            print(f"[SCRAPER] Connection links appeared on page")
+            self.logger.debug("[SCRAPER] Connection links appeared on page")
         except Exception:
-            print(f"[SCRAPER] WARNING: No /in/ links found after 15s wait - page may not have loaded connections")
-
-        last_count = 0
-        no_change_count = 0
-        load_more_fails = 0  # stop checking "Load more" after repeated misses
-
-        for scroll_num in range(max_scrolls):
-            # Batch-scroll: do 3 fast scrolls before checking count
-            self.page.evaluate("""
-                window.scrollTo(0, document.body.scrollHeight);
-            """)
-            time.sleep(0.5)
-
-            # Only check "Load more" every 5 scrolls and if it was found before
-            if load_more_fails < 3 and scroll_num % 5 == 4:
-                try:
-                    load_more = self.page.get_by_role("button", name="Load more")
-                    if load_more.is_visible(timeout=500):
-                        load_more.click()
-                        time.sleep(1)
-                        load_more_fails = 0
-                    else:
-                        load_more_fails += 1
-                except Exception:
-                    load_more_fails += 1
+            self.logger.warning("[SCRAPER] No /in/ links found after 15s wait - page may not have loaded connections")
+
+        # Debug: dump page structure to understand what LinkedIn renders. An
+        # extra evaluate plus a full screenshot, so only with DEBUG logging on
+        if self.logger.isEnabledFor(logging.DEBUG):
+            debug_info = self.page.evaluate("""() => {
+                const allLinks = document.querySelectorAll('a[href*="/in/"]');
+                const bodyText = document.body.innerText.substring(0, 500);
+                const allAnchors = document.querySelectorAll('a');
+                const sampleHrefs = Array.from(allAnchors).slice(0, 20).map(a => a.href);
+                return {
+                    inLinks: allLinks.length,
+                    totalAnchors: allAnchors.length,
+                    bodySnippet: bodyText,
+                    sampleHrefs: sampleHrefs,
+                    scrollHeight: document.body.scrollHeight
+                };
+            }""")
+            self.logger.debug(f"[SCRAPER] Debug - /in/ links: {debug_info['inLinks']}, total anchors: {debug_info['totalAnchors']}, scrollHeight: {debug_info['scrollHeight']}")
+            self.logger.debug(f"[SCRAPER] Debug - body snippet: {debug_info['bodySnippet'][:300]}")
+            self.logger.debug(f"[SCRAPER] Debug - sample hrefs: {debug_info['sampleHrefs'][:10]}")
+
+            # Save debug screenshot
+            try:
+                data_dir = settings.data_dir
+                self.page.screenshot(path=f"{data_dir}/debug_connections_page.png")
+                self.logger.debug(f"[SCRAPER] Debug screenshot saved to {data_dir}/debug_connections_page.png")
+            except Exception as e:
+                self.logger.debug(f"[SCRAPER] Debug screenshot failed: {e}")
+
+        # Scrolling runs inside the page: each step scrolls to the bottom,
+        # clicks "Load more" if present, and waits until the DOM has been quiet
+        # for 500ms (MutationObserver) instead of sleeping a fixed interval.
+        # The browser returns every few seconds so progress can be reported.
+        steps_used = 0
+        quiet_steps = 0
+        while steps_used < max_scrolls:
+            result = self.page.evaluate(
+                _AUTO_SCROLL_JS,
+                {
+                    "quietMs": 500,
+                    "maxWaitMs": 3000,
+                    "maxQuiet": 5,
+                    "sliceMs": 5000,
+                    "maxSteps": max_scrolls - steps_used,
+                    "quiet": quiet_steps,
+                },
+            )
+            steps_used += max(result["steps"], 1)
+            quiet_steps = result["quiet"]
+            current_count = result["count"]
+            approx_connections = current_count // 3
 
-            # Only count every 3 scrolls to reduce overhead
-            if scroll_num % 3 == 2:
-                current_count = self.page.evaluate(
-                    """document.querySelectorAll('a[href*="/in/"]').length"""
-                )
+            # Report progress during scrolling
+            if progress_callback:
+                progress_callback(approx_connections)
 
-                approx_connections = current_count // 3
+            self.logger.debug(f"[SCRAPER] Scroll {steps_used}: {current_count} /in/ links (~{approx_connections} connections)")
 
-                if current_count == last_count:
-                    no_change_count += 1
-                    if no_change_count >= 5:
-                        print(f"[SCRAPER] No new connections after {no_change_count} checks, stopping scroll. Total /in/ links: {current_count}")
-                        break
-                else:
-                    no_change_count = 0
-                    last_count = current_count
-
-                # Report progress during scrolling
-                if progress_callback:
-                    progress_callback(approx_connections)
-
-                # Log every check so we can see progress
-                print(f"[SCRAPER] Scroll {scroll_num + 1}: {current_count} /in/ links (~{approx_connections} connections), no_change={no_change_count}")
+            if result["done"]:
+                self.logger.info(f"[SCRAPER] No new connections after {result['quiet']} scrolls, stopping scroll. Total /in/ links: {current_count}")
+                break
+            yield
 
         # Extract connection data using JavaScript
         # Strategy: collect ALL /in/ links, group by normalised URL,
         # use innerText (preserves line breaks between elements) instead of
         # textContent (which concatenates without separators).
-        connections = self.page.evaluate("""() => {
-            const links = document.querySelectorAll('a[href*="/in/"]');
+        connections = self.page.evaluate("""(skipIds) => {
+            const skip = new Set(skipIds);
+            const localeRe = /\\/[a-z]{2}\\/$/;
+            const ariaNameRe = /^(?:View\\s+)?(.+?)(?:'s profile|$)/i;
+            // Page chrome that is never a title (case-sensitive, as before)
+            const noiseRe = /connections|Sort by|Search|Connect|Message|Follow/;
             const profileMap = {};  // normalised URL -> {names: [], el: firstElement}
 
-            links.forEach(a => {
+            // One pass over every anchor (live collection, no selector matching)
+            const anchors = document.getElementsByTagName('a');
+            for (let i = 0; i < anchors.length; i++) {
+                const a = anchors[i];
                 const href = a.getAttribute('href');
-                if (!href) return;
-                if (href.includes('/in/me/') || href.includes('/in/edit/')) return;
+                if (!href || !href.includes('/in/')) continue;
+                if (href.includes('/in/me/') || href.includes('/in/edit/')) continue;
 
                 // Normalize URL for dedup
                 let profileUrl = href;
@@ -1062,11 +1264,13 @@ class LinkedInAutomation:
                     profileUrl = 'https://www.linkedin.com' + profileUrl;
                 }
                 // Strip locale prefix like /he/ or /en/
-                profileUrl = profileUrl.replace(/\\/[a-z]{2}\\/$/, '/');
+                profileUrl = profileUrl.replace(localeRe, '/');
                 // Strip query params
                 profileUrl = profileUrl.split('?')[0];
                 // Ensure trailing slash for consistency
                 if (!profileUrl.endsWith('/')) profileUrl += '/';
+                // Already-known profile: skip the text extraction entirely
+                if (skip.size && skip.has(profileUrl.slice(0, -1).split('/').pop())) continue;
 
                 // Use innerText which preserves line breaks between block elements,
                 // preventing name+title concatenation like "John DoeEngineer at X"
@@ -1076,7 +1280,7 @@ class LinkedInAutomation:
                 const ariaLabel = a.getAttribute('aria-label');
                 if (ariaLabel) {
                     // aria-label often has just the name or "View X's profile"
-                    const m = ariaLabel.match(/^(?:View\\s+)?(.+?)(?:'s profile|$)/i);
+                    const m = ariaLabel.match(ariaNameRe);
                     if (m) nameOnly = m[1].trim();
                 }
                 if (!nameOnly) {
@@ -1101,7 +1305,7 @@ class LinkedInAutomation:
                 if (rawText) {
                     profileMap[profileUrl].rawTexts.push(rawText);
                 }
-            });
+            }
 
             const results = [];
             for (const [url, data] of Object.entries(profileMap)) {
@@ -1138,21 +1342,25 @@ class LinkedInAutomation:
                     }
                 }
 
-                // Fallback: walk up DOM to find nearby text that looks like a title
+                // Fallback: look for nearby text that looks like a title, inside
+                // the connection card (6 levels up only if no card is found)
                 if (!title) {
                     try {
-                        let container = data.el;
-                        for (let i = 0; i < 6; i++) {
-                            if (container.parentElement) container = container.parentElement;
+                        let container = data.el.closest(
+                            '[data-view-name="connection"], li, .mn-connection-card'
+                        );
+                        if (!container) {
+                            container = data.el;
+                            for (let i = 0; i < 6; i++) {
+                                if (container.parentElement) container = container.parentElement;
+                            }
                         }
                         const spans = container.querySelectorAll('span, p, div');
                         for (const el of spans) {
                             if (el.children.length > 2) continue;
                             const t = el.textContent.trim();
                             if (t && t !== fullName && t.length > 3 && t.length < 120
-                                && !t.includes('connections') && !t.includes('Sort by')
-                                && !t.includes('Search') && !t.includes('Connect')
-                                && !t.includes('Message') && !t.includes('Follow')) {
+                                && !noiseRe.test(t)) {
                                 title = t;
                                 break;
                             }
@@ -1170,7 +1378,7 @@ class LinkedInAutomation:
             }
 
             return results;
-        }""")
+        }""", list(skip_ids))
 
         self.logger.info(f"Scraped {len(connections)} connections from LinkedIn.")
         return connections
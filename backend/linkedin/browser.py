@@ -4,7 +4,7 @@ Extracted from main.py OutreachOrchestrator.launch_browser (lines 1436-1470)
 and handle_login (lines 1474-1591).
 """
 import logging
-import time
+from typing import Optional
 
 from playwright.sync_api import sync_playwright, Page, BrowserContext
 
@@ -14,26 +14,13 @@ from backend.config import settings
 logger = logging.getLogger("minutely")
 
 
-def launch_browser():
+def new_context(browser, storage_state: Optional[dict] = None):
     """
-    Launch Playwright Chromium with anti-detection settings.
+    Open a context + page on a running browser with the anti-detection settings.
 
     Returns:
-        (playwright, browser, context, page)
+        (context, page)
     """
-    import os
-    is_production = os.environ.get("RAILWAY_ENVIRONMENT") or os.environ.get("PRODUCTION")
-
-    pw = sync_playwright().start()
-    browser = pw.chromium.launch(
-        headless=bool(is_production),
-        slow_mo=100,
-        args=[
-            "--disable-blink-features=AutomationControlled",
-            "--no-sandbox",
-            "--disable-dev-shm-usage",
-        ],
-    )
     context = browser.new_context(
         viewport={"width": 1280, "height": 800},
         user_agent=(
@@ -43,6 +30,7 @@ def launch_browser():
         ),
         locale="en-US",
         timezone_id="America/New_York",
+        storage_state=storage_state,
     )
     page = context.new_page()
 
@@ -50,6 +38,32 @@ def launch_browser():
     page.add_init_script(
         "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
     )
+    return context, page
+
+
+def launch_browser(storage_state: Optional[dict] = None):
+    """
+    Launch Playwright Chromium with anti-detection settings.
+
+    storage_state (see CookieManager.load_state) seeds the new context with
+    saved cookies and localStorage.
+
+    Returns:
+        (playwright, browser, context, page)
+    """
+    pw = sync_playwright().start()
+    browser = pw.chromium.launch(
+        headless=settings.is_production,
+        # slow_mo adds a fixed pause to every Playwright call; only useful for
+        # watching a headed browser locally
+        slow_mo=0 if settings.is_production else 100,
+        args=[
+            "--disable-blink-features=AutomationControlled",
+            "--no-sandbox",
+            "--disable-dev-shm-usage",
+        ],
+    )
+    context, page = new_context(browser, storage_state)
 
     logger.info("Browser launched with anti-detection settings.")
     return pw, browser, context, page
@@ -84,56 +98,61 @@ def handle_login(context: BrowserContext, page: Page) -> bool:
     page.goto("https://www.linkedin.com/login", wait_until="domcontentloaded")
 
     # Wait for user to log in manually
-    # In the web app context, we'll poll for login status
+    # In the web app context, we'll poll for login status. Give them up to 3s
+    # to leave the login page (instant when LinkedIn redirects a live session)
     logger.info("Waiting for manual login...")
-    time.sleep(3)
+    try:
+        page.wait_for_url(lambda url: "/login" not in url, timeout=3000)
+    except Exception:
+        pass
 
-    # Verify login by checking all tabs
+    # One authoritative check first: fetch the feed with the context's cookies
+    # and see whether LinkedIn redirects to the login page or authwall
     logged_in_page = None
-    for p in context.pages:
-        try:
-            url = p.url.lower()
-            title = p.title().lower()
-
-            if "linkedin.com" in url and "login" not in url and "authwall" not in url:
-                logged_in_page = p
-                logger.info(f"Login confirmed by URL: {url}")
-                break
-
-            if "linkedin" in title and (
-                "feed" in title or "messaging" in title or "network" in title
-            ):
-                logged_in_page = p
-                logger.info(f"Login confirmed by page title: {title}")
-                break
-
-            if "linkedin.com" in url:
-                try:
-                    is_logged_in = p.evaluate("""() => {
-                        const selectors = [
-                            '.global-nav',
-                            '.feed-shared-update-v2',
-                            '.scaffold-layout',
-                            '[data-test-global-nav]',
-                            '.authentication-outlet',
-                            '.search-global-typeahead',
-                            'nav.global-nav',
-                            '#global-nav',
-                            '.ember-application .scaffold-layout'
-                        ];
-                        for (const sel of selectors) {
-                            if (document.querySelector(sel)) return true;
-                        }
-                        return false;
-                    }""")
-                    if is_logged_in:
-                        logged_in_page = p
-                        logger.info(f"Login confirmed by DOM elements (URL: {url})")
-                        break
-                except Exception:
-                    pass
-        except Exception:
-            pass
+    try:
+        resp = page.request.get("https://www.linkedin.com/feed/", timeout=15000)
+        final_url = resp.url.lower()
+        if resp.ok and "login" not in final_url and "authwall" not in final_url:
+            logged_in_page = page
+            logger.info(f"Login confirmed by feed request: {final_url}")
+    except Exception as e:
+        logger.debug(f"Feed request check failed: {e}")
+
+    # Inconclusive: fall back to checking all tabs
+    if not logged_in_page:
+        for p in context.pages:
+            try:
+                url = p.url.lower()
+                title = p.title().lower()
+
+                if "linkedin.com" in url and "login" not in url and "authwall" not in url:
+                    logged_in_page = p
+                    logger.info(f"Login confirmed by URL: {url}")
+                    break
+
+                if "linkedin" in title and (
+                    "feed" in title or "messaging" in title or "network" in title
+                ):
+                    logged_in_page = p
+                    logger.info(f"Login confirmed by page title: {title}")
+                    break
+
+                if "linkedin.com" in url:
+                    try:
+                        # One selector list: querySelector stops at the first match
+                        is_logged_in = p.evaluate("""() => !!document.querySelector(
+                            '.global-nav, .feed-shared-update-v2, .scaffold-layout, ' +
+                            '[data-test-global-nav], .authentication-outlet, ' +
+                            '.search-global-typeahead, #global-nav'
+                        )""")
+                        if is_logged_in:
+                            logged_in_page = p
+                            logger.info(f"Login confirmed by DOM elements (URL: {url})")
+                            break
+                    except Exception:
+                        pass
+            except Exception:
+                pass
 
     if not logged_in_page:
         logger.error("Could not verify login on any tab.")
@@ -2,10 +2,22 @@
 Gemini-based LinkedIn prospect classifier.
 Extracted from main.py GeminiClassifier class (lines 168-252).
 """
+import hashlib
 import logging
+import sqlite3
+import string
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
 
 import google.generativeai as genai
 
+from backend.config import settings
+
+# In-process layer in front of the on-disk label cache
+_MEMO_MAX = 4096
+
 
 class GeminiClassifier:
     """
@@ -36,45 +48,144 @@ Experience: {experience_text}
 RESPOND WITH EXACTLY ONE WORD: Sports, News, Entertainment, or Unknown.
 Do not include any other text, explanation, or punctuation."""
 
+    # PROMPT_TEMPLATE pre-split into (literal, field) pairs so building a
+    # prompt is a plain join rather than a str.format parse per call
+    _PROMPT_PARTS = tuple(
+        (literal, field) for literal, field, _spec, _conv in string.Formatter().parse(PROMPT_TEMPLATE)
+    )
+
     ALLOWED_CLASSIFICATIONS = {"Sports", "News", "Entertainment", "Unknown"}
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache_path: Optional[Path] = None):
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel("gemini-2.5-flash-lite")
         self.logger = logging.getLogger("minutely")
 
+        # Labels keyed by a hash of the profile text, so re-runs and retries
+        # don't call Gemini again. API errors are never cached.
+        self._cache_lock = threading.Lock()
+        self._memo: OrderedDict[str, str] = OrderedDict()
+        self._cache_db = None
+        try:
+            self._cache_db = sqlite3.connect(
+                str(cache_path or settings.data_dir / "gemini_cache.sqlite"),
+                check_same_thread=False,
+            )
+            self._cache_db.execute(
+                "CREATE TABLE IF NOT EXISTS labels (key TEXT PRIMARY KEY, label TEXT NOT NULL)"
+            )
+            self._cache_db.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Classification cache unavailable, using memory only: {e}")
+            self._cache_db = None
+
+    # --- Cache ---
+
+    @staticmethod
+    def _cache_key(about_text: str, experience_text: str, name: str) -> str:
+        raw = f"{name}\0{about_text or ''}\0{experience_text or ''}".encode()
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        with self._cache_lock:
+            label = self._memo.get(key)
+            if label is not None:
+                self._memo.move_to_end(key)
+                return label
+            if self._cache_db is None:
+                return None
+            try:
+                row = self._cache_db.execute(
+                    "SELECT label FROM labels WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+            if row:
+                self._remember(key, row[0])
+                return row[0]
+            return None
+
+    def _cache_put(self, key: str, label: str) -> None:
+        with self._cache_lock:
+            self._remember(key, label)
+            if self._cache_db is None:
+                return
+            try:
+                self._cache_db.execute(
+                    "INSERT OR REPLACE INTO labels (key, label) VALUES (?, ?)", (key, label)
+                )
+                self._cache_db.commit()
+            except sqlite3.Error as e:
+                self.logger.debug(f"Classification cache write failed: {e}")
+
+    def _remember(self, key: str, label: str) -> None:
+        """Add to the in-process LRU (caller holds _cache_lock)."""
+        self._memo[key] = label
+        self._memo.move_to_end(key)
+        if len(self._memo) > _MEMO_MAX:
+            self._memo.popitem(last=False)
+
+    # --- Classification ---
+
+    def _build_prompt(self, about_text: str, experience_text: str, name: str) -> str:
+        values = {
+            "name": name,
+            "about_text": about_text or "(not available)",
+            "experience_text": experience_text or "(not available)",
+        }
+        return "".join(
+            literal + (values[field] if field else "") for literal, field in self._PROMPT_PARTS
+        )
+
+    def _is_complete_label(self, text: str) -> bool:
+        """True once a streamed reply already spells out an allowed label."""
+        return text.strip().strip('"').strip("'") in self.ALLOWED_CLASSIFICATIONS
+
+    def _parse_label(self, text: str, name: str) -> str:
+        """Map Gemini's reply onto ALLOWED_CLASSIFICATIONS ("Unknown" if no match)."""
+        result = text.strip().strip('"').strip("'")
+
+        if result in self.ALLOWED_CLASSIFICATIONS:
+            self.logger.info(f"Gemini classified {name} as: {result}")
+            return result
+
+        # Try case-insensitive match
+        for allowed in self.ALLOWED_CLASSIFICATIONS:
+            if result.lower() == allowed.lower():
+                self.logger.info(f"Gemini classified {name} as: {allowed}")
+                return allowed
+
+        self.logger.warning(
+            f"Gemini returned unexpected classification '{result}' for {name}. "
+            f"Defaulting to 'Unknown'."
+        )
+        return "Unknown"
+
     def classify(self, about_text: str, experience_text: str, name: str) -> str:
         """
         Classify a prospect's industry based on their LinkedIn profile data.
 
         Returns one of: "Sports", "News", "Entertainment", "Unknown"
         """
-        prompt = self.PROMPT_TEMPLATE.format(
-            name=name,
-            about_text=about_text or "(not available)",
-            experience_text=experience_text or "(not available)",
-        )
+        key = self._cache_key(about_text, experience_text, name)
+        cached = self._cache_get(key)
+        if cached is not None:
+            self.logger.debug(f"Classification cache hit for {name}: {cached}")
+            return cached
+
+        prompt = self._build_prompt(about_text, experience_text, name)
 
         try:
             self.logger.debug(f"Sending classification request to Gemini for {name}")
-            response = self.model.generate_content(prompt)
-            result = response.text.strip().strip('"').strip("'")
-
-            if result in self.ALLOWED_CLASSIFICATIONS:
-                self.logger.info(f"Gemini classified {name} as: {result}")
-                return result
-
-            # Try case-insensitive match
-            for allowed in self.ALLOWED_CLASSIFICATIONS:
-                if result.lower() == allowed.lower():
-                    self.logger.info(f"Gemini classified {name} as: {allowed}")
-                    return allowed
-
-            self.logger.warning(
-                f"Gemini returned unexpected classification '{result}' for {name}. "
-                f"Defaulting to 'Unknown'."
-            )
-            return "Unknown"
+            # Stream and stop at the first complete label; the reply is one word
+            text = ""
+            for chunk in self.model.generate_content(prompt, stream=True):
+                text += chunk.text
+                if self._is_complete_label(text):
+                    break
+            label = self._parse_label(text, name)
+            self._cache_put(key, label)
+            return label
 
         except Exception as e:
             self.logger.error(
@@ -2,12 +2,15 @@
 Cookie persistence for LinkedIn sessions.
 Extracted from main.py CookieManager class (lines 120-163).
 """
-import json
 import logging
 from pathlib import Path
+from typing import Optional
 
+import orjson
 from playwright.sync_api import BrowserContext
 
+logger = logging.getLogger("minutely")
+
 
 class CookieManager:
     """
@@ -19,32 +22,56 @@ class CookieManager:
       - On subsequent runs, we load those cookies into the browser context
         BEFORE navigating to LinkedIn, which restores the session.
       - The critical cookie is 'li_at' which typically lasts 1-3 months.
+      - The file holds Playwright's storage state (cookies + localStorage), so
+        a new context can be created with it directly. Older files that are a
+        bare cookie list are still read.
     """
 
     @staticmethod
     def save_cookies(context: BrowserContext, filepath: Path) -> None:
-        """Extract all cookies from the browser context and save to JSON."""
+        """Save the context's storage state (cookies + localStorage) to JSON."""
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        cookies = context.cookies()
-        filepath.write_text(json.dumps(cookies, indent=2), encoding="utf-8")
-        logging.getLogger("minutely").info(f"Cookies saved to {filepath}")
+        state = context.storage_state()
+        filepath.write_bytes(orjson.dumps(state, option=orjson.OPT_INDENT_2))
+        logger.info(f"Cookies saved to {filepath}")
+
+    @staticmethod
+    def load_state(filepath: Path) -> Optional[dict]:
+        """
+        Read a saved file as a storage-state dict for new_context(storage_state=...).
+        Returns None if the file is missing or corrupt.
+        """
+        try:
+            data = orjson.loads(filepath.read_bytes())
+        except FileNotFoundError:
+            logger.debug("No cookie file found.")
+            return None
+        except orjson.JSONDecodeError as e:
+            # Also covers an empty file
+            logger.warning(f"Failed to load cookies: {e}")
+            return None
+        if isinstance(data, list):
+            # Legacy format: bare cookie list
+            return {"cookies": data, "origins": []}
+        if isinstance(data, dict) and isinstance(data.get("cookies"), list):
+            return data
+        logger.warning(f"Unrecognised cookie file format: {filepath}")
+        return None
 
     @staticmethod
     def load_cookies(context: BrowserContext, filepath: Path) -> bool:
         """
-        Load cookies from JSON into the browser context.
+        Load cookies from JSON into an existing browser context.
         Returns True on success, False if file is missing or corrupt.
         """
-        logger = logging.getLogger("minutely")
-        if not filepath.exists() or filepath.stat().st_size == 0:
-            logger.debug("No cookie file found.")
+        state = CookieManager.load_state(filepath)
+        if state is None:
             return False
         try:
-            cookies = json.loads(filepath.read_text(encoding="utf-8"))
-            context.add_cookies(cookies)
+            context.add_cookies(state["cookies"])
             logger.info("Cookies loaded from file.")
             return True
-        except (json.JSONDecodeError, Exception) as e:
+        except Exception as e:
             logger.warning(f"Failed to load cookies: {e}")
             return False
 
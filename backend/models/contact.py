@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Index
 from sqlalchemy.orm import relationship
 from backend.database import Base
 from datetime import datetime
@@ -6,6 +6,13 @@ from datetime import datetime
 
 class Contact(Base):
     __tablename__ = "contacts"
+    # Every listing is scoped to one owner, so the owner leads each index
+    __table_args__ = (
+        Index("ix_contacts_owner_industry", "owner_linkedin_id", "industry"),
+        Index("ix_contacts_owner_full_name", "owner_linkedin_id", "full_name"),
+        # Batch selection: connected contacts ordered by last_shown_at
+        Index("ix_contacts_owner_connected_shown", "owner_linkedin_id", "is_connected", "last_shown_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     linkedin_id = Column(String(100), unique=True, nullable=False, index=True)
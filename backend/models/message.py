@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from backend.database import Base
 from datetime import datetime
@@ -6,6 +6,12 @@ from datetime import datetime
 
 class Message(Base):
     __tablename__ = "messages"
+    __table_args__ = (
+        # "Already messaged?" lookups per contact (batch selection anti-join)
+        Index("ix_messages_contact_type_status", "contact_id", "message_type", "status"),
+        # Follow-up selection: equality columns first, then the sent_at range
+        Index("ix_messages_owner_type_status_sent", "owner_linkedin_id", "message_type", "status", "sent_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     contact_id = Column(Integer, ForeignKey("contacts.id"), nullable=False)
@@ -0,0 +1,23 @@
+from functools import lru_cache
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+def list_response(model: type[BaseModel], rows) -> Response:
+    """Serialize ORM rows as a JSON list of `model`, skipping validation.
+
+    List rows come straight from the DB, so they are built with
+    model_construct (no field validation) and dumped by pydantic-core in one
+    call. The body is already JSON, so it goes out as a plain Response rather
+    than through ORJSONResponse, and FastAPI's second validation pass against
+    response_model is skipped too; the route's response_model still documents
+    the shape.
+    """
+    items = [model.model_construct(**row.__dict__) for row in rows]
+    return Response(_list_adapter(model).dump_json(items), media_type="application/json")
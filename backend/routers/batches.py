@@ -1,7 +1,7 @@
 from datetime import date
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from backend.database import get_db
 from backend.models.message import Message
@@ -61,6 +61,7 @@ def get_recent_messages(db: Session = Depends(get_db)):
     """Diagnostic: show recent messages and their statuses."""
     messages = (
         db.query(Message)
+        .options(selectinload(Message.contact))
         .order_by(Message.id.desc())
         .limit(20)
         .all()
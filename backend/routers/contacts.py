@@ -1,16 +1,16 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import and_, case, func, or_
 from typing import Optional
 
 from backend.database import get_db
+from backend.routers import list_response
 from backend.models.contact import Contact
 from backend.schemas.contact import ContactOut, ContactUpdate, ContactStats
 from backend.auth import get_optional_user_id, get_user_id
 
 router = APIRouter()
 
-
 @router.get("", response_model=list[ContactOut])
 def list_contacts(
     industry: Optional[str] = None,
@@ -19,6 +19,7 @@ def list_contacts(
     connected_only: bool = False,
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=200),
+    after_id: Optional[int] = Query(None, description="Keyset cursor: id of the last contact of the previous page (overrides page)"),
     db: Session = Depends(get_db),
     user_id: str | None = Depends(get_optional_user_id),
 ):
@@ -41,15 +42,22 @@ def list_contacts(
             )
         )
 
-    total = query.count()
-    contacts = (
-        query
-        .order_by(Contact.full_name.asc())
-        .offset((page - 1) * per_page)
-        .limit(per_page)
-        .all()
-    )
-    return contacts
+    query = query.order_by(Contact.full_name.asc(), Contact.id.asc())
+    if after_id is not None:
+        # Seek past the cursor row in (full_name, id) order instead of OFFSET
+        anchor = db.query(Contact.full_name).filter(Contact.id == after_id).scalar()
+        if anchor is None:
+            return []
+        query = query.filter(
+            or_(
+                Contact.full_name > anchor,
+                and_(Contact.full_name == anchor, Contact.id > after_id),
+            )
+        )
+    else:
+        query = query.offset((page - 1) * per_page)
+
+    return list_response(ContactOut, query.limit(per_page).all())
 
 
 @router.get("/stats", response_model=ContactStats)
@@ -58,13 +66,15 @@ def get_stats(db: Session = Depends(get_db), user_id: str | None = Depends(get_o
         return ContactStats(total=0, connected=0, by_industry={}, messaged=0, replied=0)
     base = db.query(Contact).filter(Contact.owner_linkedin_id == user_id)
 
-    total = base.count()
-    connected = base.filter(Contact.is_connected == True).count()  # noqa: E712
-    messaged = base.filter(Contact.last_messaged_at.isnot(None)).count()
-    replied = base.filter(Contact.has_replied == True).count()  # noqa: E712
+    # All four counters in one pass over the user's contacts
+    total, connected, messaged, replied = base.with_entities(
+        func.count(Contact.id),
+        func.coalesce(func.sum(case((Contact.is_connected == True, 1), else_=0)), 0),  # noqa: E712
+        func.coalesce(func.sum(case((Contact.last_messaged_at.isnot(None), 1), else_=0)), 0),
+        func.coalesce(func.sum(case((Contact.has_replied == True, 1), else_=0)), 0),  # noqa: E712
+    ).one()
 
     # Industry breakdown
-    from sqlalchemy import func
     industry_query = base.with_entities(Contact.industry, func.count(Contact.id)).group_by(Contact.industry)
     industry_rows = industry_query.all()
     by_industry = {row[0]: row[1] for row in industry_rows}
@@ -6,7 +6,9 @@ import uuid
 from fastapi import APIRouter, Depends, Response
 from fastapi.responses import JSONResponse, FileResponse
 from pydantic import BaseModel
+from sqlalchemy import func
 from sqlalchemy.orm import Session
+from backend.config import settings
 from backend.database import get_db
 from backend.models.contact import Contact
 from backend.schemas.batch import JobStatusOut
@@ -139,9 +141,9 @@ def get_contacts_status(db: Session = Depends(get_db), user_id: str | None = Dep
         return {"cached": False, "count": 0, "user_id": None}
 
     count = (
-        db.query(Contact)
+        db.query(func.count(Contact.id))
         .filter(Contact.owner_linkedin_id == user_id, Contact.is_connected == True)  # noqa: E712
-        .count()
+        .scalar()
     )
     return {"cached": count > 0, "count": count, "user_id": user_id}
 
@@ -149,7 +151,6 @@ def get_contacts_status(db: Session = Depends(get_db), user_id: str | None = Dep
 @router.get("/debug/owners")
 def debug_owners(db: Session = Depends(get_db)):
     """Diagnostic: show contact counts grouped by owner_linkedin_id."""
-    from sqlalchemy import func
     rows = (
         db.query(Contact.owner_linkedin_id, func.count(Contact.id))
         .group_by(Contact.owner_linkedin_id)
@@ -161,7 +162,6 @@ def debug_owners(db: Session = Depends(get_db)):
 @router.post("/take-screenshot")
 async def take_screenshot(user_id: str = Depends(get_user_id)):
     """Take a screenshot of the current browser page."""
-    import asyncio
     session = worker_pool.get_session(user_id)
     if not session or not session._page:
         return {"error": "No browser page available"}
@@ -169,11 +169,7 @@ async def take_screenshot(user_id: str = Depends(get_user_id)):
     try:
         import time as time_mod
         path = f"/tmp/linkedin_debug_manual_{int(time_mod.time())}.png"
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            session._executor,
-            lambda: session._page.screenshot(path=path)
-        )
+        await session.submit(lambda: session._page.screenshot(path=path))
         with open(path, "rb") as f:
             data = base64.b64encode(f.read()).decode()
         return {"file": path, "data": f"data:image/png;base64,{data}"}
@@ -202,8 +198,7 @@ def get_latest_screenshot():
 @router.get("/debug-screenshot")
 def get_debug_screenshot():
     """Return the debug screenshot from the last scrape attempt."""
-    data_dir = os.environ.get("DATA_DIR", ".")
-    path = os.path.join(data_dir, "debug_connections_page.png")
+    path = os.path.join(settings.data_dir, "debug_connections_page.png")
     if os.path.exists(path):
         return FileResponse(path, media_type="image/png")
     return JSONResponse({"error": "No debug screenshot found"}, status_code=404)
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, Query
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 from typing import Optional
 
 from backend.database import get_db
+from backend.routers import list_response
 from backend.auth import get_optional_user_id
 from backend.models.message import Message
 from backend.schemas.message import MessageOut, MessageTemplateOut
@@ -10,7 +12,6 @@ from backend.services.message_service import get_templates
 
 router = APIRouter()
 
-
 @router.get("", response_model=list[MessageOut])
 def list_messages(
     contact_id: Optional[int] = None,
@@ -18,6 +19,7 @@ def list_messages(
     message_type: Optional[str] = None,
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=200),
+    before_id: Optional[int] = Query(None, description="Keyset cursor: id of the last message of the previous page (overrides page)"),
     db: Session = Depends(get_db),
     user_id: Optional[str] = Depends(get_optional_user_id),
 ):
@@ -31,13 +33,22 @@ def list_messages(
     if message_type:
         query = query.filter(Message.message_type == message_type)
 
-    messages = (
-        query.order_by(Message.created_at.desc())
-        .offset((page - 1) * per_page)
-        .limit(per_page)
-        .all()
-    )
-    return messages
+    query = query.order_by(Message.created_at.desc(), Message.id.desc())
+    if before_id is not None:
+        # Seek past the cursor row in (created_at, id) order instead of OFFSET
+        anchor = db.query(Message.created_at).filter(Message.id == before_id).scalar()
+        if anchor is None:
+            return []
+        query = query.filter(
+            or_(
+                Message.created_at < anchor,
+                and_(Message.created_at == anchor, Message.id < before_id),
+            )
+        )
+    else:
+        query = query.offset((page - 1) * per_page)
+
+    return list_response(MessageOut, query.limit(per_page).all())
 
 
 @router.get("/templates", response_model=list[MessageTemplateOut])
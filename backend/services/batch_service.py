@@ -1,8 +1,9 @@
 import logging
 from datetime import date, datetime, timedelta, time
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, exists, insert, or_, update
 
 from backend.models.contact import Contact
 from backend.models.message import Message
@@ -19,26 +20,77 @@ from backend.config import settings
 
 logger = logging.getLogger("minutely")
 
+# Validates a whole list of Contact rows in one call instead of one
+# ContactOut.model_validate() per row
+_CONTACT_LIST = TypeAdapter(list[ContactOut])
+
+# Correlated anti-join target: the contact already got an initial message.
+# NOT EXISTS is planned as an anti-join on ix_messages_contact_type_status,
+# where NOT IN (subquery) materializes the whole list first. Pre-fetching the
+# messaged ids into a Python list is no cheaper: the outer scan walks
+# ix_contacts_owner_connected_shown in ORDER BY order and stops at the LIMIT,
+# so only ~batch_size index probes run, while the list would cost a read of
+# every sent message on each call.
+_SENT_INITIAL = exists().where(
+    Message.contact_id == Contact.id,
+    Message.message_type == "initial",
+    Message.status == "sent",
+)
+
+
+def _add_to_batch(db: Session, batch_id: int, contacts: list[Contact], now: datetime) -> None:
+    """Stamp contacts as shown and add them to the batch.
+
+    One UPDATE ... WHERE id IN (...) and one multi-row INSERT, instead of an
+    UPDATE and an INSERT per contact. The UPDATE also refreshes last_shown_at
+    on the loaded Contact objects (synchronize_session).
+    """
+    if not contacts:
+        return
+    ids = [c.id for c in contacts]
+    db.execute(
+        update(Contact)
+        .where(Contact.id.in_(ids))
+        .values(last_shown_at=now)
+        .execution_options(synchronize_session="evaluate")
+    )
+    db.execute(
+        insert(DailyBatchContact),
+        [{"batch_id": batch_id, "contact_id": cid} for cid in ids],
+    )
+
 
 def get_or_create_today_batch(db: Session, user_id: str = "") -> TodayBatchOut:
     """Get today's batch of contacts, or generate a new one."""
     today = date.today()
 
-    batch_query = db.query(DailyBatch).filter(DailyBatch.batch_date == today)
+    # Entries and their contacts in two IN-list queries instead of one per entry.
+    # The contacts' own relationships are never read here, so any lazy load on
+    # them raises instead of quietly bringing the N+1 back.
+    batch_query = (
+        db.query(DailyBatch)
+        .options(
+            selectinload(DailyBatch.entries)
+            .selectinload(DailyBatchContact.contact)
+            .raiseload("*", sql_only=True)
+        )
+        .filter(DailyBatch.batch_date == today)
+    )
     if user_id:
         batch_query = batch_query.filter(DailyBatch.user_id == user_id)
     batch = batch_query.first()
 
     if batch and len(batch.entries) > 0:
+        entries = batch.entries
+        contact_outs = _CONTACT_LIST.validate_python([entry.contact for entry in entries])
         contacts = []
-        for entry in batch.entries:
-            contact = entry.contact
+        for entry, contact_out in zip(entries, contact_outs):
             suggested = build_initial_message(
-                contact.first_name, contact.company, contact.industry
+                contact_out.first_name, contact_out.company, contact_out.industry
             )
             contacts.append(
                 BatchContactOut(
-                    contact=ContactOut.model_validate(contact),
+                    contact=contact_out,
                     selected=entry.selected,
                     suggested_message=suggested,
                     message_id=entry.message_id,
@@ -46,21 +98,9 @@ def get_or_create_today_batch(db: Session, user_id: str = "") -> TodayBatchOut:
             )
         return TodayBatchOut(batch_date=today, contacts=contacts)
 
-    if not batch:
-        batch = DailyBatch(batch_date=today, batch_type="initial", user_id=user_id)
-        db.add(batch)
-        db.flush()
-
-    cutoff = datetime.utcnow() - timedelta(days=settings.cooldown_days)
-
-    already_messaged_ids = (
-        db.query(Message.contact_id)
-        .filter(
-            Message.message_type == "initial",
-            Message.status == "sent",
-        )
-        .subquery()
-    )
+    # One clock read per batch: the cooldown cutoff and last_shown_at agree
+    now = datetime.utcnow()
+    cutoff = now - timedelta(days=settings.cooldown_days)
 
     owner_filter = [Contact.owner_linkedin_id == user_id] if user_id else []
 
@@ -72,7 +112,7 @@ def get_or_create_today_batch(db: Session, user_id: str = "") -> TodayBatchOut:
                 Contact.last_shown_at.is_(None),
                 Contact.last_shown_at < cutoff,
             ),
-            ~Contact.id.in_(already_messaged_ids),
+            ~_SENT_INITIAL,
             *owner_filter,
         )
         .order_by(Contact.last_shown_at.asc().nullsfirst())
@@ -80,17 +120,26 @@ def get_or_create_today_batch(db: Session, user_id: str = "") -> TodayBatchOut:
         .all()
     )
 
+    # New batch row, its entries and the last_shown_at stamp all go out as
+    # plain statements in one transaction, committed once below
+    if batch:
+        batch_id = batch.id
+    else:
+        batch_id = db.execute(
+            insert(DailyBatch)
+            .values(batch_date=today, batch_type="initial", user_id=user_id)
+            .returning(DailyBatch.id)
+        ).scalar_one()
+    _add_to_batch(db, batch_id, eligible, now)
+
     contacts = []
-    for contact in eligible:
-        contact.last_shown_at = datetime.utcnow()
-        entry = DailyBatchContact(batch_id=batch.id, contact_id=contact.id)
-        db.add(entry)
+    for contact_out in _CONTACT_LIST.validate_python(eligible):
         suggested = build_initial_message(
-            contact.first_name, contact.company, contact.industry
+            contact_out.first_name, contact_out.company, contact_out.industry
         )
         contacts.append(
             BatchContactOut(
-                contact=ContactOut.model_validate(contact),
+                contact=contact_out,
                 selected=False,
                 suggested_message=suggested,
             )
@@ -127,13 +176,9 @@ def refresh_unselected(db: Session, keep_contact_ids: list[int], user_id: str =
         return get_or_create_today_batch(db, user_id=user_id)
 
     existing_ids = {e.contact_id for e in kept_entries}
-    cutoff = datetime.utcnow() - timedelta(days=settings.cooldown_days)
-
-    already_messaged_ids = (
-        db.query(Message.contact_id)
-        .filter(Message.message_type == "initial", Message.status == "sent")
-        .subquery()
-    )
+    # One clock read per batch: the cooldown cutoff and last_shown_at agree
+    now = datetime.utcnow()
+    cutoff = now - timedelta(days=settings.cooldown_days)
 
     owner_filter = [Contact.owner_linkedin_id == user_id] if user_id else []
 
@@ -142,7 +187,7 @@ def refresh_unselected(db: Session, keep_contact_ids: list[int], user_id: str =
         .filter(
             Contact.is_connected == True,  # noqa: E712
             or_(Contact.last_shown_at.is_(None), Contact.last_shown_at < cutoff),
-            ~Contact.id.in_(already_messaged_ids),
+            ~_SENT_INITIAL,
             ~Contact.id.in_(existing_ids) if existing_ids else True,
             *owner_filter,
         )
@@ -151,10 +196,7 @@ def refresh_unselected(db: Session, keep_contact_ids: list[int], user_id: str =
         .all()
     )
 
-    for contact in new_eligible:
-        contact.last_shown_at = datetime.utcnow()
-        db.add(DailyBatchContact(batch_id=batch.id, contact_id=contact.id))
-
+    _add_to_batch(db, batch.id, new_eligible, now)
     db.commit()
     logger.info(f"Refreshed batch: kept {len(kept_entries)}, added {len(new_eligible)} new.")
     return get_or_create_today_batch(db, user_id=user_id)
@@ -162,32 +204,39 @@ def refresh_unselected(db: Session, keep_contact_ids: list[int], user_id: str =
 
 def get_followup_contacts(db: Session, user_id: str = "") -> FollowUpBatchOut:
     """Get contacts who were messaged 2 days ago and haven't replied."""
+    # Half-open day range: [start of that day, start of the next day)
     two_days_ago_start = datetime.combine(date.today() - timedelta(days=2), time.min)
-    two_days_ago_end = datetime.combine(date.today() - timedelta(days=2), time.max)
+    two_days_ago_end = two_days_ago_start + timedelta(days=1)
 
-    query = db.query(Message).filter(
-        Message.message_type == "initial",
-        Message.status == "sent",
-        Message.sent_at >= two_days_ago_start,
-        Message.sent_at <= two_days_ago_end,
+    # One JOIN with the replied filter in SQL, returning (sent_at, Contact)
+    # rows: the Message entity (and its content text) is never hydrated
+    query = (
+        db.query(Message.sent_at, Contact)
+        .join(Contact, Contact.id == Message.contact_id)
+        .filter(
+            Message.message_type == "initial",
+            Message.status == "sent",
+            Message.sent_at >= two_days_ago_start,
+            Message.sent_at < two_days_ago_end,
+            Contact.has_replied.isnot(True),  # NULL counts as not replied
+        )
     )
     if user_id:
         query = query.filter(Message.owner_linkedin_id == user_id)
 
-    messages = query.all()
-
+    # Streamed in chunks of 200 rather than materialized with .all(); each
+    # chunk's contacts are validated in one TypeAdapter call
     followups = []
-    for msg in messages:
-        contact = msg.contact
-        if contact.has_replied:
-            continue
-        suggested = build_followup_message(contact.first_name)
-        followups.append(
-            FollowUpItem(
-                contact=ContactOut.model_validate(contact),
-                original_message_date=msg.sent_at,
-                suggested_followup=suggested,
+    result = db.execute(query.statement.execution_options(yield_per=200))
+    for chunk in result.partitions():
+        contact_outs = _CONTACT_LIST.validate_python([contact for _sent_at, contact in chunk])
+        for (sent_at, _contact), contact_out in zip(chunk, contact_outs):
+            followups.append(
+                FollowUpItem(
+                    contact=contact_out,
+                    original_message_date=sent_at,
+                    suggested_followup=build_followup_message(contact_out.first_name),
+                )
             )
-        )
 
     return FollowUpBatchOut(contacts=followups)
@@ -1,8 +1,11 @@
 import uuid
 import logging
+import string
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from backend.models.contact import Contact
@@ -84,18 +87,39 @@ TEMPLATES_HE = {
 }
 
 
+def _parse_template(template: str) -> tuple[tuple[str, Optional[str]], ...]:
+    """Split a template into (literal, field) pairs once, for _render()."""
+    return tuple(
+        (literal, field) for literal, field, _spec, _conv in string.Formatter().parse(template)
+    )
+
+
+def _render(parts: tuple[tuple[str, Optional[str]], ...], values: dict) -> str:
+    return "".join(literal + (values[field] if field else "") for literal, field in parts)
+
+
+# Templates pre-split at import, so building a message is a join instead of
+# a str.format() parse per contact
+_INITIAL_PARTS = {industry: _parse_template(t) for industry, t in TEMPLATES["initial"].items()}
+_FOLLOWUP_PARTS = _parse_template(TEMPLATES["followup"]["default"])
+
+
+# Batches re-render the same (name, company, industry) tuples across runs and
+# refreshes; the inputs are plain strings, so the results are safe to memoize.
+# Call .cache_clear() on both builders if TEMPLATES is ever changed at runtime.
+@lru_cache(maxsize=4096)
 def build_initial_message(
     name: str, company: str = "", industry: str = "Unknown"
 ) -> str:
     """Build an initial outreach message."""
-    templates = TEMPLATES["initial"]
-    template = templates.get(industry, templates["Unknown"])
-    return template.format(name=name, company=company or "your company")
+    parts = _INITIAL_PARTS.get(industry, _INITIAL_PARTS["Unknown"])
+    return _render(parts, {"name": name, "company": company or "your company"})
 
 
+@lru_cache(maxsize=4096)
 def build_followup_message(name: str) -> str:
     """Build a follow-up message."""
-    return TEMPLATES["followup"]["default"].format(name=name)
+    return _render(_FOLLOWUP_PARTS, {"name": name})
 
 
 def get_templates(
@@ -119,6 +143,27 @@ def get_templates(
     return results
 
 
+def _existing_contact_ids(db: Session, contact_ids: list[int]) -> set[int]:
+    """Which of the given contact ids exist, in one IN query.
+
+    Selects only the id column as plain scalars: no Contact objects and no
+    Row tuples are built, since existence is all the callers need.
+    """
+    if not contact_ids:
+        return set()
+    return set(db.scalars(select(Contact.id).where(Contact.id.in_(set(contact_ids)))))
+
+
+def _insert_messages(db: Session, rows: list[dict]) -> list[int]:
+    """Insert message rows in one INSERT ... RETURNING; ids come back in row order."""
+    if not rows:
+        return []
+    return db.execute(
+        insert(Message).returning(Message.id, sort_by_parameter_order=True),
+        rows,
+    ).scalars().all()
+
+
 async def queue_initial_messages(
     db: Session, items: list[SendItem], user_id: str = ""
 ) -> JobStatusOut:
@@ -126,24 +171,19 @@ async def queue_initial_messages(
     from backend.worker.worker_pool import worker_pool
     from backend.worker.task_queue import WorkerTask, TaskType
 
-    message_ids = []
-    for item in items:
-        contact = db.query(Contact).filter(Contact.id == item.contact_id).first()
-        if not contact:
-            continue
-
-        message = Message(
-            contact_id=item.contact_id,
-            message_type="initial",
-            content=item.message,
-            attach_video=item.attach_video,
-            status="queued",
-            owner_linkedin_id=user_id,
-        )
-        db.add(message)
-        db.flush()
-        message_ids.append(message.id)
-
+    known = _existing_contact_ids(db, [item.contact_id for item in items])
+    message_ids = _insert_messages(db, [
+        {
+            "contact_id": item.contact_id,
+            "message_type": "initial",
+            "content": item.message,
+            "attach_video": item.attach_video,
+            "status": "queued",
+            "owner_linkedin_id": user_id,
+        }
+        for item in items
+        if item.contact_id in known
+    ])
     db.commit()
     logger.info(f"Queued {len(message_ids)} initial messages for user {user_id}.")
 
@@ -165,27 +205,20 @@ async def queue_followup_messages(
     from backend.worker.worker_pool import worker_pool
     from backend.worker.task_queue import WorkerTask, TaskType
 
-    message_ids = []
-    for item in items:
-        if not item.send:
-            continue
-
-        contact = db.query(Contact).filter(Contact.id == item.contact_id).first()
-        if not contact:
-            continue
-
-        message = Message(
-            contact_id=item.contact_id,
-            message_type="followup",
-            content=item.message,
-            attach_video=False,
-            status="queued",
-            owner_linkedin_id=user_id,
-        )
-        db.add(message)
-        db.flush()
-        message_ids.append(message.id)
-
+    items = [item for item in items if item.send]
+    known = _existing_contact_ids(db, [item.contact_id for item in items])
+    message_ids = _insert_messages(db, [
+        {
+            "contact_id": item.contact_id,
+            "message_type": "followup",
+            "content": item.message,
+            "attach_video": False,
+            "status": "queued",
+            "owner_linkedin_id": user_id,
+        }
+        for item in items
+        if item.contact_id in known
+    ])
     db.commit()
     logger.info(f"Queued {len(message_ids)} follow-up messages for user {user_id}.")
 
@@ -3,35 +3,84 @@ import logging
 from datetime import datetime
 from pathlib import Path
 
+from sqlalchemy import insert
+
 from backend.database import SessionLocal
 from backend.models.contact import Contact
 from backend.models.message import Message
 
 logger = logging.getLogger("minutely")
 
+# Rows per INSERT batch
+CHUNK_SIZE = 1000
+
+# CLI pipeline statuses (leads.csv "Status" column)
+_MESSAGED_STATUSES = frozenset({"Message1Sent", "Message2Sent", "Replied"})
+_FOLLOWED_UP_STATUSES = frozenset({"Message2Sent", "Replied"})
+_CONNECTED_STATUSES = _MESSAGED_STATUSES | {"Connected"}
+
+
+def _insert_chunk(db, contact_rows: list[dict], message_plans: list[tuple]) -> None:
+    """Insert a chunk of contacts, then the CLI-sent messages that reference them.
+
+    message_plans[i] is (message_types, sent_at) for contact_rows[i].
+    """
+    if not contact_rows:
+        return
+    ids = db.execute(
+        insert(Contact).returning(Contact.id, sort_by_parameter_order=True),
+        contact_rows,
+    ).scalars().all()
+
+    message_rows = [
+        {
+            "contact_id": contact_id,
+            "message_type": message_type,
+            "content": "(sent via CLI)",
+            "status": "sent",
+            "sent_at": sent_at,
+        }
+        for contact_id, (message_types, sent_at) in zip(ids, message_plans)
+        for message_type in message_types
+    ]
+    if message_rows:
+        db.execute(insert(Message), message_rows)
+
 
 def migrate_leads_csv(csv_path: Path):
-    """One-time migration from leads.csv to SQLite contacts table."""
+    """Import leads.csv into the contacts table.
+
+    Rows whose profile is already stored are skipped, so re-running after
+    leads.csv grows only adds the new leads.
+    """
     if not csv_path.exists():
         logger.info("No leads.csv found, skipping migration.")
         return
 
     db = SessionLocal()
     try:
-        # Skip if already migrated
-        if db.query(Contact).count() > 0:
-            logger.info("Contacts table already populated, skipping CSV migration.")
-            return
+        # Every stored profile id, loaded once for an in-memory membership test
+        existing = {linkedin_id for (linkedin_id,) in db.query(Contact.linkedin_id)}
 
         with open(csv_path, "r", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             count = 0
+            skipped = 0
+            # Rows are buffered and written CHUNK_SIZE at a time: one multi-row
+            # INSERT for the contacts (ids come back via RETURNING), then one
+            # for their messages
+            contact_rows = []
+            message_plans = []
             for row in reader:
                 url = row.get("Profile_URL", "").strip()
                 if not url:
                     continue
 
-                linkedin_id = url.rstrip("/").split("/")[-1]
+                linkedin_id = url.rstrip("/").rpartition("/")[2]
+                if linkedin_id in existing:
+                    skipped += 1
+                    continue
+                existing.add(linkedin_id)
                 name = row.get("Name", "").strip()
                 status = row.get("Status", "New").strip()
                 last_contact = row.get("Last_Contact_Date", "").strip()
@@ -44,50 +93,38 @@ def migrate_leads_csv(csv_path: Path):
                     except ValueError:
                         pass
 
-                is_messaged = status in {"Message1Sent", "Message2Sent", "Replied"}
-
-                contact = Contact(
-                    linkedin_id=linkedin_id,
-                    profile_url=url,
-                    full_name=name,
-                    first_name=name.split()[0] if name else "",
-                    company=row.get("Company", "").strip(),
-                    industry=row.get("Industry", "Unknown").strip() or "Unknown",
-                    is_connected=status in {
-                        "Connected", "Message1Sent", "Message2Sent", "Replied"
-                    },
-                    connection_status="connected" if status != "New" else "unknown",
-                    last_messaged_at=messaged_at if is_messaged else None,
-                    has_replied=status == "Replied",
-                )
-                db.add(contact)
-                db.flush()
-
-                # Create Message records for contacts already messaged via CLI
+                is_messaged = status in _MESSAGED_STATUSES
+
+                contact_rows.append({
+                    "linkedin_id": linkedin_id,
+                    "profile_url": url,
+                    "full_name": name,
+                    "first_name": name.partition(" ")[0],
+                    "company": row.get("Company", "").strip(),
+                    "industry": row.get("Industry", "Unknown").strip() or "Unknown",
+                    "is_connected": status in _CONNECTED_STATUSES,
+                    "connection_status": "connected" if status != "New" else "unknown",
+                    "last_messaged_at": messaged_at if is_messaged else None,
+                    "has_replied": status == "Replied",
+                })
+
+                # Message records for contacts already messaged via CLI,
+                # written once the contact ids are known
+                message_types = ()
                 if is_messaged and messaged_at:
-                    msg = Message(
-                        contact_id=contact.id,
-                        message_type="initial",
-                        content="(sent via CLI)",
-                        status="sent",
-                        sent_at=messaged_at,
-                    )
-                    db.add(msg)
-
-                    if status in {"Message2Sent", "Replied"}:
-                        msg2 = Message(
-                            contact_id=contact.id,
-                            message_type="followup",
-                            content="(sent via CLI)",
-                            status="sent",
-                            sent_at=messaged_at,
-                        )
-                        db.add(msg2)
+                    message_types = ("initial",)
+                    if status in _FOLLOWED_UP_STATUSES:
+                        message_types = ("initial", "followup")
+                message_plans.append((message_types, messaged_at))
 
                 count += 1
+                if len(contact_rows) >= CHUNK_SIZE:
+                    _insert_chunk(db, contact_rows, message_plans)
+                    contact_rows, message_plans = [], []
 
+            _insert_chunk(db, contact_rows, message_plans)
             db.commit()
-            logger.info(f"Migrated {count} leads from CSV to database.")
+            logger.info(f"Migrated {count} leads from CSV to database ({skipped} already present).")
 
     except Exception as e:
         db.rollback()
@@ -6,18 +6,22 @@ Each UserSession owns:
 - Its own Playwright browser/context/page
 - Its own cookie file ({DATA_DIR}/cookies/{user_id}.json)
 """
+import asyncio
 import logging
 import random
-import threading
+import re
 import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
+
+from sqlalchemy import func, insert, update
+from sqlalchemy.orm import joinedload
 
 from backend.config import settings
 from backend.database import SessionLocal
-from backend.linkedin.automation import LinkedInAutomation
-from backend.linkedin.browser import launch_browser
+from backend.linkedin.automation import LinkedInAutomation, wait_for_first_visible
+from backend.linkedin.browser import launch_browser, new_context
 from backend.linkedin.cookies import CookieManager
 from backend.models.contact import Contact
 from backend.models.message import Message
@@ -25,13 +29,45 @@ from backend.worker.task_queue import WorkerTask, TaskType
 
 logger = logging.getLogger("minutely")
 
+# Skip the pre-flight login check if the session was seen logged in this recently
+LOGIN_RECHECK_SECONDS = 300
+
+# Tasks in the same lane share a page and run one at a time. Scrapes get their
+# own context and hand the PW thread back between scroll slices, so a scrape
+# and a send for the same user interleave.
+_TASK_LANES = {
+    TaskType.SEND_MESSAGES: "send",
+    TaskType.SEND_FOLLOWUPS: "send",
+    TaskType.SCRAPE_CONNECTIONS: "scrape",
+}
+
+# Checkpoint page controls, most specific first
+_VERIFY_INPUT_SELECTORS = (
+    "input#input__email_verification_pin",
+    "input#input__phone_verification_pin",
+    "input[name='pin']",
+    "input[type='text']",
+)
+_VERIFY_SUBMIT_SELECTORS = (
+    "button#two-step-submit-button",
+    "button[type='submit']",
+    "button:has-text('Submit')",
+    "button:has-text('Verify')",
+)
+
+# IN-list size for the scrape ingest's existing-row lookup (well under
+# SQLite's bound-parameter limit)
+LOOKUP_CHUNK = 500
+
+
+_COMPANY_RE = re.compile(r'\b(?:at|@)\s+(.+?)(?:\s*[|·•,]|$)', re.IGNORECASE)
+
 
 def extract_company_from_title(title: str) -> str:
     """Extract company name from LinkedIn title text."""
-    import re
     if not title:
         return ""
-    match = re.search(r'\b(?:at|@)\s+(.+?)(?:\s*[|·•,]|$)', title, re.IGNORECASE)
+    match = _COMPANY_RE.search(title)
     if match:
         return match.group(1).strip()
     return ""
@@ -49,9 +85,15 @@ class UserSession:
         self._page = None
         self._linkedin: Optional[LinkedInAutomation] = None
         self._browser_ready = False
-        self._checking_login = False
-        self._task_running = False  # True while a task is executing
+        # In-flight check_login() call, shared by concurrent callers
+        self._login_check: Optional[asyncio.Future] = None
+        self._login_check_forced = False
+        self._task_running = 0  # Number of tasks executing (at most one per lane)
+        self._task_locks = {lane: asyncio.Lock() for lane in set(_TASK_LANES.values())}
         self._close_requested = False  # Set when close() is called during a task
+        self.save_cookies_on_close = True  # Cleared on logout
+        self._login_verified_at = 0.0  # time.time() of the last confirmed login
+        self._nav_count = 0  # Profile visits since the context was (re)created
         self.last_activity = time.time()
 
     @property
@@ -68,6 +110,15 @@ class UserSession:
             return "no_browser"
         return "idle"
 
+    def submit(self, fn, *args) -> asyncio.Future:
+        """Run fn(*args) on this session's Playwright thread and await the result.
+
+        Every Playwright call for a session goes through its single-thread
+        executor, so the sync API stays pinned to one OS thread and calls
+        run in submission order.
+        """
+        return asyncio.wrap_future(self._executor.submit(fn, *args))
+
     def is_idle(self, timeout: int) -> bool:
         """Check if session has been inactive for longer than timeout seconds."""
         return time.time() - self.last_activity > timeout
@@ -78,21 +129,82 @@ class UserSession:
 
     # --- Browser lifecycle ---
 
+    def _ensure_browser(self) -> bool:
+        """Reuse this session's browser if it is still alive, else launch one.
+
+        Chromium start-up is the slowest step of a login, and a session that
+        lost its LinkedIn login (expired cookies, failed verification) still
+        has a perfectly good browser/context to retry in.
+
+        A new browser's context is created with the saved storage state;
+        returns True in that case so callers don't load the cookies again.
+        """
+        try:
+            if (
+                self._browser is not None
+                and self._browser.is_connected()
+                and self._page is not None
+                and not self._page.is_closed()
+            ):
+                logger.debug(f"[{self.user_id}] Reusing running browser.")
+                return False
+        except Exception:
+            pass
+        self._close_browser()
+        state = CookieManager.load_state(self.cookies_file)
+        self._pw, self._browser, self._context, self._page = launch_browser(storage_state=state)
+        self._nav_count = 0
+        return state is not None
+
+    def _rotate_context(self):
+        """Swap in a fresh context + page on the running browser (runs in PW thread).
+
+        A long-lived context accumulates page/navigation state that Playwright
+        never releases, so memory grows with every profile visit. Recycling
+        just the context drops that while keeping Chromium warm; the storage
+        state carries the LinkedIn login across.
+        """
+        try:
+            state = self._context.storage_state()
+            context, page = new_context(self._browser, storage_state=state)
+        except Exception as e:
+            # Keep going on the old context rather than failing the task
+            logger.warning(f"[{self.user_id}] Context rotation failed: {e}")
+            return
+        old_context = self._context
+        self._context, self._page = context, page
+        self._linkedin = LinkedInAutomation(page)
+        self._nav_count = 0
+        try:
+            old_context.close()
+        except Exception as e:
+            logger.debug(f"[{self.user_id}] Closing old context: {e}")
+        logger.info(f"[{self.user_id}] Browser context recycled.")
+
+    def _restore_saved_login(self, state_loaded: bool) -> bool:
+        """Check for a LinkedIn login from saved cookies (runs in PW thread)."""
+        if not state_loaded:
+            if not CookieManager.cookies_exist(self.cookies_file):
+                return False
+            if not CookieManager.load_cookies(self._context, self.cookies_file):
+                return False
+        logger.info(f"[{self.user_id}] Attempting cookie-based login...")
+        linkedin = LinkedInAutomation(self._page)
+        if not linkedin.check_login_status():
+            return False
+        self._linkedin = linkedin
+        self._browser_ready = True
+        self._login_verified_at = time.time()
+        self._touch()
+        return True
+
     def do_launch_and_login(self):
         """Launch browser and try cookie-based login (runs in PW thread)."""
-        self._close_browser()
-        self._pw, self._browser, self._context, self._page = launch_browser()
-
-        if CookieManager.cookies_exist(self.cookies_file):
-            logger.info(f"[{self.user_id}] Attempting cookie-based login...")
-            if CookieManager.load_cookies(self._context, self.cookies_file):
-                linkedin = LinkedInAutomation(self._page)
-                if linkedin.check_login_status():
-                    self._linkedin = linkedin
-                    self._browser_ready = True
-                    logger.info(f"[{self.user_id}] Browser ready (cookie login).")
-                    self._touch()
-                    return
+        state_loaded = self._ensure_browser()
+
+        if self._restore_saved_login(state_loaded):
+            logger.info(f"[{self.user_id}] Browser ready (cookie login).")
+            return
 
         logger.info(f"[{self.user_id}] Opening LinkedIn login page...")
         self._page.goto("https://www.linkedin.com/login", wait_until="domcontentloaded")
@@ -100,20 +212,12 @@ class UserSession:
 
     def do_credential_login(self, email: str, password: str) -> dict:
         """Login with email/password (runs in PW thread)."""
-        self._close_browser()
-        self._pw, self._browser, self._context, self._page = launch_browser()
+        state_loaded = self._ensure_browser()
 
         # Try saved cookies first
-        if CookieManager.cookies_exist(self.cookies_file):
-            logger.info(f"[{self.user_id}] Trying saved cookies first...")
-            if CookieManager.load_cookies(self._context, self.cookies_file):
-                linkedin = LinkedInAutomation(self._page)
-                if linkedin.check_login_status():
-                    self._linkedin = linkedin
-                    self._browser_ready = True
-                    self._touch()
-                    logger.info(f"[{self.user_id}] Login via saved cookies.")
-                    return {"status": "connected", "message": "Logged in via saved cookies"}
+        if self._restore_saved_login(state_loaded):
+            logger.info(f"[{self.user_id}] Login via saved cookies.")
+            return {"status": "connected", "message": "Logged in via saved cookies"}
 
         # Navigate to login page
         self._page.goto("https://www.linkedin.com/login", wait_until="domcontentloaded")
@@ -157,41 +261,16 @@ class UserSession:
             return {"status": "failed", "message": "No browser session. Login first."}
 
         try:
-            input_selectors = [
-                "input#input__email_verification_pin",
-                "input#input__phone_verification_pin",
-                "input[name='pin']",
-                "input[type='text']",
-            ]
-            filled = False
-            for sel in input_selectors:
-                try:
-                    el = self._page.locator(sel)
-                    if el.is_visible(timeout=2000):
-                        el.fill(code)
-                        filled = True
-                        break
-                except Exception:
-                    continue
-
-            if not filled:
+            # One raced wait per control instead of a timeout per selector
+            pin_input = wait_for_first_visible(self._page, _VERIFY_INPUT_SELECTORS, timeout=5000)
+            if pin_input is None:
                 return {"status": "failed", "message": "Could not find verification input field"}
+            pin_input.fill(code)
 
             time.sleep(0.5)
-            submit_selectors = [
-                "button#two-step-submit-button",
-                "button[type='submit']",
-                "button:has-text('Submit')",
-                "button:has-text('Verify')",
-            ]
-            for sel in submit_selectors:
-                try:
-                    btn = self._page.locator(sel)
-                    if btn.is_visible(timeout=2000):
-                        btn.click()
-                        break
-                except Exception:
-                    continue
+            submit_btn = wait_for_first_visible(self._page, _VERIFY_SUBMIT_SELECTORS, timeout=2000)
+            if submit_btn is not None:
+                submit_btn.click()
 
             time.sleep(8)
             current_url = self._page.url.lower()
@@ -207,13 +286,25 @@ class UserSession:
         except Exception as e:
             return {"status": "failed", "message": str(e)}
 
+    async def check_login(self, force: bool = False) -> bool:
+        """check_and_finalize_login(), shared between concurrent callers.
+
+        The frontend polls while the user may also hit "check" by hand; a
+        caller arriving while a check is in flight awaits that one instead of
+        queueing another round of navigation. A forced check only joins a
+        forced one, since a plain check never leaves the current page.
+        """
+        inflight = self._login_check
+        if inflight is None or inflight.done() or (force and not self._login_check_forced):
+            inflight = self.submit(self.check_and_finalize_login, force)
+            self._login_check, self._login_check_forced = inflight, force
+        # shield: a caller going away must not cancel the others' check
+        return await asyncio.shield(inflight)
+
     def check_and_finalize_login(self, force: bool = False) -> bool:
         """Check if user has logged in (runs in PW thread)."""
         if not self._page:
             return False
-        if self._checking_login:
-            return False
-        self._checking_login = True
 
         try:
             current_url = self._page.url.lower()
@@ -252,39 +343,76 @@ class UserSession:
             return False
         except Exception:
             return False
-        finally:
-            self._checking_login = False
 
     # --- Task execution ---
 
-    def execute_task(self, task: WorkerTask):
-        """Execute a task in this user's browser (runs in PW thread)."""
+    async def run_task(self, task: WorkerTask):
+        """Run a task to completion, stepping it on the PW thread.
+
+        Send tasks pause on each profile and between messages; those pauses
+        are awaited here instead of slept on the PW thread, so quick calls for
+        this session (login checks, screenshots, a scrape on its own context)
+        get the thread in the meantime. The lane lock keeps this user's other tasks
+        of the same kind from taking over the page.
+        """
+        async with self._task_locks[_TASK_LANES.get(task.task_type, "send")]:
+            task.status = "running"
+            task.started_at = time.time()
+            logger.info(f"Processing task {task.task_id} ({task.task_type}) for user {self.user_id}...")
+            steps = self.execute_task(task)
+            try:
+                while (delay := await self.submit(next, steps, None)) is not None:
+                    # 0: just a yield point, so other work queued for the PW
+                    # thread runs before the next step
+                    if delay:
+                        logger.info(f"[{self.user_id}] Safety delay: {delay:.0f}s...")
+                    await asyncio.sleep(delay)
+            finally:
+                # Runs the task's cleanup (db session, deferred close) if it
+                # was cancelled mid-pause; a no-op once it has finished
+                try:
+                    await self.submit(steps.close)
+                except RuntimeError as e:
+                    # Executor already shut down by close(); the generator's
+                    # cleanup touches Playwright, so it can't run here instead
+                    logger.warning(f"[{self.user_id}] Task {task.task_id} left unfinished: {e}")
+
+    def execute_task(self, task: WorkerTask) -> Iterator[float]:
+        """Execute a task in this user's browser (runs in PW thread).
+
+        A generator: each value is a pause (seconds) the caller should wait
+        before resuming it. Only run_task() should drive it.
+        """
         if not self._browser_ready:
             task.error = "Browser not ready. Please login first."
             task.status = "failed"
             return
 
         self._touch()
-        self._task_running = True
-        self._close_requested = False
+        if not self._task_running:
+            # Only a fresh start clears a pending close: one requested while
+            # the other lane's task runs must survive this task starting
+            self._close_requested = False
+        self._task_running += 1
 
         try:
             if task.task_type == TaskType.SEND_MESSAGES:
-                self._send_messages(task)
+                yield from self._send_messages(task)
             elif task.task_type == TaskType.SEND_FOLLOWUPS:
-                self._send_messages(task)  # Same logic
+                yield from self._send_messages(task)  # Same logic
             elif task.task_type == TaskType.SCRAPE_CONNECTIONS:
-                self._scrape_connections(task)
+                yield from self._scrape_connections(task)
         finally:
-            self._task_running = False
+            self._task_running -= 1
             self._touch()
-            # If close was requested while task was running, do it now (in PW thread)
-            if self._close_requested:
+            # If close was requested while tasks were running, do it once the
+            # last one is done (in PW thread)
+            if self._close_requested and not self._task_running:
                 logger.info(f"[{self.user_id}] Deferred close: executing now that task is done.")
                 self._do_browser_cleanup()
 
-    def _send_messages(self, task: WorkerTask):
-        """Send messages to contacts."""
+    def _send_messages(self, task: WorkerTask) -> Iterator[float]:
+        """Send messages to contacts, yielding each safety pause."""
         message_ids = task.payload.get("message_ids", [])
         task.total = len(message_ids)
 
@@ -292,9 +420,11 @@ class UserSession:
             logger.warning(f"[{self.user_id}] No message IDs to send.")
             return
 
-        # Pre-flight: verify LinkedIn session is still active
-        logger.info(f"[{self.user_id}] Pre-flight login check before sending {len(message_ids)} messages...")
-        if not self._linkedin.check_login_status():
+        # Pre-flight: verify LinkedIn session is still active, unless it was
+        # confirmed recently (a redirect to login during sending clears that)
+        if time.time() - self._login_verified_at < LOGIN_RECHECK_SECONDS:
+            logger.info(f"[{self.user_id}] Login confirmed recently, skipping pre-flight check.")
+        elif not self._linkedin.check_login_status():
             logger.error(f"[{self.user_id}] LinkedIn session expired! Attempting cookie re-login...")
             # Try to reload cookies
             if CookieManager.cookies_exist(self.cookies_file):
@@ -306,29 +436,47 @@ class UserSession:
                     # Mark all messages as failed
                     db = SessionLocal()
                     try:
-                        for msg_id in message_ids:
-                            message = db.query(Message).filter(Message.id == msg_id).first()
-                            if message:
-                                message.status = "failed"
-                                message.error_message = "LinkedIn session expired"
+                        db.query(Message).filter(Message.id.in_(message_ids)).update(
+                            {"status": "failed", "error_message": "LinkedIn session expired"},
+                            synchronize_session=False,
+                        )
                         db.commit()
                     finally:
                         db.close()
                     return
                 logger.info(f"[{self.user_id}] Cookie re-login successful!")
+                self._login_verified_at = time.time()
             else:
                 logger.error(f"[{self.user_id}] No cookies file found. Cannot re-login.")
                 task.error = "LinkedIn session expired. Please re-login."
                 task.status = "failed"
                 return
+        else:
+            self._login_verified_at = time.time()
 
         logger.info(f"[{self.user_id}] Login verified. Starting to send {len(message_ids)} messages.")
 
-        db = SessionLocal()
+        # expire_on_commit=False: the commits below would otherwise expire the
+        # prefetched rows and reload each one on next access. This thread is
+        # the only writer of these messages while the task runs.
+        #
+        # Status changes stay in the session (autoflush is off, so no write
+        # lock is held) and are committed once per send attempt, before the
+        # pause; failures that skip straight to the next contact ride along
+        # with the next commit. A sent message is never left uncommitted
+        # across a pause: its contact would otherwise be picked again.
+        db = SessionLocal(expire_on_commit=False)
         nav_failures = 0
         try:
+            # All messages and their contacts in one query instead of one per id
+            messages_by_id = {
+                m.id: m
+                for m in db.query(Message)
+                .options(joinedload(Message.contact))
+                .filter(Message.id.in_(message_ids))
+            }
             for idx, msg_id in enumerate(message_ids):
-                message = db.query(Message).filter(Message.id == msg_id).first()
+                message = messages_by_id.get(msg_id)
                 if not message:
                     task.progress += 1
                     continue
@@ -336,13 +484,18 @@ class UserSession:
                 contact = message.contact
                 logger.info(f"[{self.user_id}][MSG {idx+1}/{len(message_ids)}] {contact.full_name} -> {contact.profile_url}")
                 message.status = "sending"
-                db.commit()
+
+                rotate_every = settings.context_rotate_navigations
+                if rotate_every and self._nav_count >= rotate_every:
+                    self._rotate_context()
 
                 if not self._linkedin.navigate_to_profile(contact.profile_url):
+                    if not self._is_logged_in_url(self._page.url.lower()):
+                        # Redirected to login/authwall: force a full check next task
+                        self._login_verified_at = 0.0
                     nav_failures += 1
                     message.status = "failed"
                     message.error_message = "Failed to navigate to profile"
-                    db.commit()
                     task.progress += 1
                     # If 3+ consecutive nav failures, session is probably dead
                     if nav_failures >= 3:
@@ -350,18 +503,30 @@ class UserSession:
                         task.error = f"{nav_failures} consecutive navigation failures. Session may have expired."
                         task.status = "failed"
                         # Mark remaining messages as failed
-                        for remaining_id in message_ids[idx+1:]:
-                            rem = db.query(Message).filter(Message.id == remaining_id).first()
-                            if rem:
-                                rem.status = "failed"
-                                rem.error_message = "Aborted: session expired"
+                        remaining_ids = message_ids[idx+1:]
+                        if remaining_ids:
+                            db.query(Message).filter(Message.id.in_(remaining_ids)).update(
+                                {"status": "failed", "error_message": "Aborted: session expired"},
+                                synchronize_session=False,
+                            )
                         db.commit()
                         return
                     continue
                 else:
                     nav_failures = 0  # Reset on success
-
-                self._random_delay()
+                    self._login_verified_at = time.time()
+                    self._nav_count += 1
+
+                # Dwell on the profile before messaging. Other calls may use the
+                # page meanwhile (a forced login check opens /feed), so come
+                # back to the profile if it was navigated away from.
+                profile_page_url = self._page.url
+                yield self._pick_delay()
+                if self._page.url != profile_page_url and not self._linkedin.navigate_to_profile(contact.profile_url):
+                    message.status = "failed"
+                    message.error_message = "Failed to navigate to profile"
+                    task.progress += 1
+                    continue
 
                 if self._linkedin.detect_security_challenge():
                     message.status = "failed"
@@ -384,7 +549,6 @@ class UserSession:
                     logger.error(f"[{self.user_id}][MSG {idx+1}] Exception: {e}")
                     message.status = "failed"
                     message.error_message = f"Exception: {str(e)[:200]}"
-                    db.commit()
                     task.progress += 1
                     continue
 
@@ -402,22 +566,36 @@ class UserSession:
                 task.progress += 1
 
                 if task.progress < task.total:
-                    self._random_delay()
+                    yield self._pick_delay()
+
+            # Failures after the last send
+            db.commit()
         finally:
+            if db.new or db.dirty:
+                # Loop died mid-batch: keep the outcomes recorded so far
+                try:
+                    db.commit()
+                except Exception as e:
+                    logger.error(f"[{self.user_id}] Saving message statuses failed: {e}")
             db.close()
 
-    def _scrape_connections(self, task: WorkerTask):
-        """Scrape LinkedIn connections and upsert into database."""
+    def _scrape_connections(self, task: WorkerTask) -> Iterator[float]:
+        """Scrape LinkedIn connections and upsert into database.
+
+        Yields 0 between scroll slices to let a send task's steps run.
+        """
         owner_id = self.user_id
         force = task.payload.get("force", False)
 
         if not force and owner_id:
             db = SessionLocal()
             try:
+                # Plain COUNT(id): Query.count() would wrap a SELECT of every
+                # column in a subquery first
                 cached_count = (
-                    db.query(Contact)
-                    .filter(Contact.owner_linkedin_id == owner_id, Contact.is_connected == True)
-                    .count()
+                    db.query(func.count(Contact.id))
+                    .filter(Contact.owner_linkedin_id == owner_id, Contact.is_connected == True)  # noqa: E712
+                    .scalar()
                 )
                 if cached_count > 0:
                     task.status = "completed"
@@ -429,61 +607,141 @@ class UserSession:
                 db.close()
 
         task.status = "scrolling"
-        print(f"[SCRAPER][{self.user_id}] Starting scrape...")
+        logger.info(f"[{self.user_id}] Starting scrape...")
 
         def on_scroll_progress(connections_found: int):
             task.progress = connections_found
 
-        connections = self._linkedin.scrape_connections_list(progress_callback=on_scroll_progress)
+        # Contacts already stored for this owner with nothing left to fill in
+        # would be a no-op below, so the scraper doesn't extract them at all
+        db = SessionLocal()
+        try:
+            complete_ids = {
+                row[0]
+                for row in db.query(Contact.linkedin_id).filter(
+                    Contact.owner_linkedin_id == owner_id,
+                    Contact.is_connected == True,  # noqa: E712
+                    Contact.connection_status == "connected",
+                    Contact.title != "",
+                    Contact.company != "",
+                )
+            }
+        finally:
+            db.close()
+
+        # Scrape in a separate context on the same browser (sharing the
+        # login), leaving the main page to the send lane. Closed afterwards:
+        # the connections page is a big DOM.
+        context, page = new_context(self._browser, storage_state=self._context.storage_state())
+        scrape = LinkedInAutomation(page).scrape_connections_list(
+            progress_callback=on_scroll_progress, skip_ids=complete_ids
+        )
+        try:
+            while True:
+                try:
+                    next(scrape)
+                except StopIteration as done:
+                    connections = done.value
+                    break
+                yield 0
+        finally:
+            scrape.close()
+            try:
+                context.close()
+            except Exception as e:
+                logger.debug(f"[{self.user_id}] Closing scrape context: {e}")
         task.status = "saving"
         task.progress = 0
         task.total = len(connections)
-        print(f"[SCRAPER][{self.user_id}] Found {len(connections)} connections")
+        logger.info(f"[{self.user_id}] Found {len(connections)} new/changed connections ({len(complete_ids)} already complete)")
 
         db = SessionLocal()
         try:
-            added = 0
-            for conn in connections:
-                url = conn["profile_url"]
-                linkedin_id = url.rstrip("/").split("/")[-1]
+            # Parse each scraped row once up front; rsplit only splits off
+            # the last path segment (the profile ID)
+            parsed = [
+                {
+                    "linkedin_id": conn["profile_url"].rstrip("/").rsplit("/", 1)[-1],
+                    "profile_url": conn["profile_url"],
+                    "full_name": conn["full_name"],
+                    "title": conn.get("title", ""),
+                }
+                for conn in connections
+            ]
 
-                existing = db.query(Contact).filter(Contact.linkedin_id == linkedin_id).first()
-                title_text = conn.get("title", "")
+            # Look up the stored rows for these IDs up front (columns only, no
+            # ORM objects) instead of one SELECT per connection. Distinct IDs
+            # only, in IN-lists of at most LOOKUP_CHUNK parameters
+            unique_ids = list(dict.fromkeys(p["linkedin_id"] for p in parsed))
+            existing_by_id = {}
+            for start in range(0, len(unique_ids), LOOKUP_CHUNK):
+                rows = db.query(Contact.id, Contact.linkedin_id, Contact.title, Contact.company).filter(
+                    Contact.linkedin_id.in_(unique_ids[start:start + LOOKUP_CHUNK])
+                )
+                for row in rows:
+                    existing_by_id[row.linkedin_id] = row
+
+            # One timestamp for the whole ingest instead of a utcnow() per
+            # row in the column defaults / onupdate
+            now = datetime.utcnow()
+            new_rows = {}
+            updates = {}
+            for p in parsed:
+                linkedin_id = p["linkedin_id"]
+                title_text = p["title"]
                 company = extract_company_from_title(title_text)
 
+                existing = existing_by_id.get(linkedin_id)
                 if existing:
-                    existing.is_connected = True
-                    existing.connection_status = "connected"
-                    # Always update owner to the current (real) user ID
-                    # Fixes temp IDs like "login-xxx" being replaced with actual profile ID
-                    existing.owner_linkedin_id = owner_id
-                    if title_text and not existing.title:
-                        existing.title = title_text
-                    if company and not existing.company:
-                        existing.company = company
-                else:
-                    full_name = conn["full_name"]
-                    contact = Contact(
-                        linkedin_id=linkedin_id,
-                        profile_url=url,
-                        full_name=full_name,
-                        first_name=full_name.split()[0] if full_name else "",
-                        title=title_text,
-                        company=company,
-                        is_connected=True,
-                        connection_status="connected",
-                        owner_linkedin_id=owner_id,
-                    )
-                    db.add(contact)
-                    added += 1
-
-                task.progress += 1
+                    changes = updates.setdefault(linkedin_id, {
+                        "id": existing.id,
+                        "is_connected": True,
+                        "connection_status": "connected",
+                        # Always update owner to the current (real) user ID
+                        # Fixes temp IDs like "login-xxx" being replaced with actual profile ID
+                        "owner_linkedin_id": owner_id,
+                        "title": existing.title,
+                        "company": existing.company,
+                        "updated_at": now,
+                    })
+                    if title_text and not changes["title"]:
+                        changes["title"] = title_text
+                    if company and not changes["company"]:
+                        changes["company"] = company
+                elif linkedin_id not in new_rows:
+                    full_name = p["full_name"]
+                    new_rows[linkedin_id] = {
+                        "linkedin_id": linkedin_id,
+                        "profile_url": p["profile_url"],
+                        "full_name": full_name,
+                        "first_name": full_name.split(None, 1)[0] if full_name else "",
+                        "title": title_text,
+                        "company": company,
+                        "is_connected": True,
+                        "connection_status": "connected",
+                        "owner_linkedin_id": owner_id,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+
+            # One executemany per statement: batched multi-row INSERT, and
+            # UPDATE ... WHERE id = ? keyed on the primary key
+            if new_rows:
+                db.execute(insert(Contact), list(new_rows.values()))
+            if updates:
+                db.execute(update(Contact), list(updates.values()))
+            added = len(new_rows)
+            task.progress = len(connections)
 
             db.commit()
             task.status = "completed"
-            task.progress = len(connections)
-            task.total = len(connections)
-            logger.info(f"[{self.user_id}] Scraping complete: {len(connections)} found, {added} new.")
+            # Report the whole network, including contacts skipped as complete
+            task.progress = len(connections) + len(complete_ids)
+            task.total = task.progress
+            logger.info(
+                f"[{self.user_id}] Scraping complete: {len(connections)} scraped, {added} new, "
+                f"{len(complete_ids)} skipped as complete."
+            )
         finally:
             db.close()
 
@@ -503,15 +761,24 @@ class UserSession:
         """Mark session as connected and save cookies."""
         self._linkedin = LinkedInAutomation(self._page)
         self._browser_ready = True
+        self._login_verified_at = time.time()
         CookieManager.save_cookies(self._context, self.cookies_file)
         self._touch()
         logger.info(f"[{self.user_id}] Login confirmed, cookies saved.")
         return {"status": "connected", "message": "Successfully logged in to LinkedIn"}
 
-    def _random_delay(self):
-        delay = random.randint(settings.min_delay, settings.max_delay)
-        logger.info(f"[{self.user_id}] Safety delay: {delay}s...")
-        time.sleep(delay)
+    @staticmethod
+    def _pick_delay() -> float:
+        """Random safety delay in [min_delay, max_delay], biased low.
+
+        Exponential above min_delay (mean a third of the way up the range),
+        truncated at max_delay, so most pauses are short with the odd long
+        one - less dead time per batch than a uniform pick.
+        """
+        span = settings.max_delay - settings.min_delay
+        if span <= 0:
+            return float(settings.min_delay)
+        return settings.min_delay + min(random.expovariate(3 / span), span)
 
     def get_debug_info(self) -> dict:
         if not self._page:
@@ -528,8 +795,16 @@ class UserSession:
 
     def _do_browser_cleanup(self):
         """Actually close browser resources. MUST run in PW thread."""
+        # LinkedIn rotates session cookies while the browser runs; persist the
+        # current ones so the next reconnect (e.g. after a deploy) starts warm.
+        if self.save_cookies_on_close and self._linkedin is not None and self._context is not None:
+            try:
+                CookieManager.save_cookies(self._context, self.cookies_file)
+            except Exception as e:
+                logger.debug(f"[{self.user_id}] Saving cookies on close failed: {e}")
         self._browser_ready = False
         self._linkedin = None
+        self._login_verified_at = 0.0
         try:
             if self._browser:
                 self._browser.close()
@@ -16,6 +16,9 @@ from backend.worker.user_session import UserSession
 
 logger = logging.getLogger("minutely")
 
+# A supervised loop that ran this long before crashing restarts from the 1s backoff
+_SUPERVISE_HEALTHY_SECS = 60
+
 
 class WorkerPool:
     """Manages multiple UserSession instances with LRU eviction."""
@@ -26,6 +29,8 @@ class WorkerPool:
         self._running = False
         self._loop_task = None
         self._reaper_task = None
+        # In-flight _dispatch() tasks (strong refs so they aren't collected)
+        self._dispatches: set[asyncio.Task] = set()
         self._lock = asyncio.Lock()
         # Track pending login sessions (keyed by temp login token)
         self._login_sessions: dict[str, UserSession] = {}
@@ -33,17 +38,18 @@ class WorkerPool:
     async def start(self):
         """Start the worker pool processing loop."""
         self._running = True
-        self._loop_task = asyncio.create_task(self._run_loop())
-        self._reaper_task = asyncio.create_task(self._reap_idle_sessions())
+        self._loop_task = asyncio.create_task(self._supervise("Task loop", self._run_loop))
+        self._reaper_task = asyncio.create_task(self._supervise("Reaper", self._reap_idle_sessions))
         logger.info(f"Worker pool started (max {settings.max_concurrent_browsers} browsers).")
 
     async def stop(self):
         """Stop all sessions and the processing loop."""
         self._running = False
-        if self._loop_task:
-            self._loop_task.cancel()
-        if self._reaper_task:
-            self._reaper_task.cancel()
+        tasks = [t for t in (self._loop_task, self._reaper_task) if t]
+        tasks.extend(self._dispatches)
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
         for session in list(self._sessions.values()):
             session.close()
         for session in list(self._login_sessions.values()):
@@ -100,8 +106,7 @@ class WorkerPool:
         async with self._lock:
             session = await self._ensure_session(user_id)
 
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(session._executor, session.do_launch_and_login)
+        await session.submit(session.do_launch_and_login)
 
         if session.is_browser_ready:
             logger.info(f"Auto-reconnected user {user_id} from cookies.")
@@ -120,13 +125,11 @@ class WorkerPool:
         async with self._lock:
             session = await self._ensure_session(user_id)
 
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(session._executor, session.do_credential_login, email, password)
+        result = await session.submit(session.do_credential_login, email, password)
 
         if result.get("status") == "connected":
             # Detect actual LinkedIn ID from the browser
-            actual_id = await loop.run_in_executor(
-                session._executor,
+            actual_id = await session.submit(
                 lambda: session._linkedin.get_my_profile_id() if session._linkedin else user_id
             )
             if actual_id and actual_id != user_id:
@@ -136,8 +139,7 @@ class WorkerPool:
                     session.user_id = actual_id
                     self._sessions[actual_id] = session
                 # Re-save cookies under the real ID so reconnect works
-                await loop.run_in_executor(
-                    session._executor,
+                await session.submit(
                     lambda: self._copy_cookies(user_id, actual_id)
                 )
                 result["user_id"] = actual_id
@@ -163,12 +165,10 @@ class WorkerPool:
         if not session:
             return {"status": "failed", "message": "No active login session. Start login first."}
 
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(session._executor, session.do_submit_verification, code)
+        result = await session.submit(session.do_submit_verification, code)
 
         if result.get("status") == "connected":
-            actual_id = await loop.run_in_executor(
-                session._executor,
+            actual_id = await session.submit(
                 lambda: session._linkedin.get_my_profile_id() if session._linkedin else user_id
             )
             if actual_id and actual_id != user_id:
@@ -177,8 +177,7 @@ class WorkerPool:
                     session.user_id = actual_id
                     self._sessions[actual_id] = session
                 # Re-save cookies under the real ID
-                await loop.run_in_executor(
-                    session._executor,
+                await session.submit(
                     lambda: self._copy_cookies(user_id, actual_id)
                 )
                 result["user_id"] = actual_id
@@ -193,12 +192,10 @@ class WorkerPool:
         if not session:
             return {"logged_in": False, "browser_connected": False}
 
-        loop = asyncio.get_event_loop()
-        success = await loop.run_in_executor(session._executor, session.check_and_finalize_login, force)
+        success = await session.check_login(force)
 
         if success:
-            actual_id = await loop.run_in_executor(
-                session._executor,
+            actual_id = await session.submit(
                 lambda: session._linkedin.get_my_profile_id() if session._linkedin else user_id
             )
             if actual_id and actual_id != user_id:
@@ -220,6 +217,7 @@ class WorkerPool:
             session = self._sessions.pop(user_id, None)
 
         if session:
+            session.save_cookies_on_close = False
             if session._task_running:
                 logger.warning(f"User {user_id} logout requested while task is running - will close after task completes.")
             session.close()  # Thread-safe: defers if task is running
@@ -272,40 +270,71 @@ class WorkerPool:
             session.close()
             del self._sessions[uid]
 
-    async def _run_loop(self):
-        """Main processing loop - dequeue tasks and execute in user sessions."""
+    async def _supervise(self, name: str, loop_fn):
+        """Run a background loop, restarting it with exponential backoff if it crashes.
+
+        The backoff resets once a restart has stayed up for a minute, so a
+        crash days later doesn't wait out the delay left by an earlier burst.
+        """
+        backoff = 1
         while self._running:
+            started = time.monotonic()
             try:
-                task = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-            except asyncio.TimeoutError:
-                continue
+                await loop_fn()
+                return
             except asyncio.CancelledError:
-                break
-
-            user_id = task.payload.get("user_id", "")
-            if not user_id:
-                task.status = "failed"
-                task.error = "No user_id in task"
-                continue
+                raise
+            except Exception:
+                if time.monotonic() - started >= _SUPERVISE_HEALTHY_SECS:
+                    backoff = 1
+                logger.exception(f"{name} died, restarting in {backoff}s")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 60)
 
-            task.status = "running"
-            task.started_at = time.time()
-            logger.info(f"Processing task {task.task_id} ({task.task_type}) for user {user_id}...")
+    async def _run_loop(self):
+        """Main processing loop - dequeue tasks and hand them to user sessions.
 
+        Everything already queued when the loop wakes is drained in one pass
+        and dispatched concurrently: different users' tasks run in parallel on
+        their own Playwright threads. Within a user, sends run one at a
+        time in order; a scrape uses its own browser context and can overlap
+        them (see UserSession.run_task).
+        """
+        while self._running:
+            # Sleeps until a task arrives; stop() cancels this task to exit
             try:
-                async with self._lock:
-                    session = await self._ensure_session(user_id)
+                ready = [await self._queue.get()]
+            except asyncio.CancelledError:
+                break
+            while not self._queue.empty():
+                ready.append(self._queue.get_nowait())
+
+            for task in ready:
+                dispatch = asyncio.create_task(self._dispatch(task))
+                self._dispatches.add(dispatch)
+                dispatch.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, task: WorkerTask):
+        """Run one task in its user's session and record the outcome."""
+        user_id = task.payload.get("user_id", "")
+        if not user_id:
+            task.status = "failed"
+            task.error = "No user_id in task"
+            return
 
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(session._executor, session.execute_task, task)
-                if task.status == "running":
-                    task.status = "completed"
-            except Exception as e:
-                task.status = "failed"
-                task.error = str(e)
-                logger.error(f"Task {task.task_id} failed: {e}")
+        try:
+            async with self._lock:
+                session = await self._ensure_session(user_id)
+
+            await session.run_task(task)
+            if task.status == "running":
+                task.status = "completed"
+        except Exception as e:
+            task.status = "failed"
+            task.error = str(e)
+            logger.error(f"Task {task.task_id} failed: {e}")
 
-            task_registry.cleanup_old()
+        task_registry.cleanup_old()
 
     async def _reap_idle_sessions(self):
         """Periodically close sessions that have been idle too long."""
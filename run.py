@@ -1,22 +1,31 @@
 """Single entry point for Minute.ly web application."""
-import os
+import importlib.util
 import logging
 import uvicorn
 
+from backend.config import settings
 from backend.log_buffer import setup_log_buffer
 
 logging.basicConfig(level=logging.INFO)
 # Capture all minutely logs into an in-memory ring buffer for the /api/linkedin/logs endpoint
 setup_log_buffer()
 
-if __name__ == "__main__":
-    port = int(os.environ.get("PORT", 8000))
-    host = os.environ.get("HOST", "0.0.0.0")
 
+
+def _has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+if __name__ == "__main__":
+    # uvloop/httptools ship with uvicorn[standard] on Linux/macOS; fall back to
+    # the stdlib loop and h11 where they aren't available (e.g. Windows).
+    # Single worker: browser sessions and the task queue live in-process.
     uvicorn.run(
         "backend.app:app",
-        host=host,
-        port=port,
+        host=settings.host,
+        port=settings.port,
         reload=False,
         log_level="info",
+        loop="uvloop" if _has_module("uvloop") else "asyncio",
+        http="httptools" if _has_module("httptools") else "h11",
     )